@@ -72,6 +72,7 @@ NPC_PATROL_WAIT_TIME = 2.0  # Seconds to wait at each patrol point
 NPC_DEFAULT_SPEED = 2.0  # Units per second
 NPC_SCALE = (0.4, 0.9, 0.4)  # Render scale (x, y, z) - tall and thin
 NPC_CULLING_RADIUS = 0.5  # Radius for frustum culling
+NPC_SLEEP_DISTANCE = 50.0  # Idle NPCs farther than this from the player skip AI updates
 
 # UI settings (Phase 5)
 UI_DIALOGUE_BOX_WIDTH = 800  # Width of dialogue box in pixels
@@ -1,5 +1,5 @@
 """Equipment system for player gear."""
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from dataclasses import dataclass
 from enum import Enum, auto
 
@@ -83,6 +83,8 @@ class Equipment:
             EquipmentSlot.ARMOR: None,
             EquipmentSlot.ACCESSORY: None,
         }
+        # (damage, defense, health, stamina) totals, None until recomputed
+        self._bonus_cache: Optional[Tuple[int, int, int, int]] = None
 
     def equip(self, item: EquipmentItem) -> Optional[EquipmentItem]:
         """
@@ -96,6 +98,7 @@ class Equipment:
         """
         old_item = self.slots[item.slot]
         self.slots[item.slot] = item
+        self._bonus_cache = None
         return old_item
 
     def unequip(self, slot: EquipmentSlot) -> Optional[EquipmentItem]:
@@ -110,43 +113,48 @@ class Equipment:
         """
         item = self.slots[slot]
         self.slots[slot] = None
+        self._bonus_cache = None
         return item
 
     def get_equipped(self, slot: EquipmentSlot) -> Optional[EquipmentItem]:
         """Get currently equipped item in a slot."""
         return self.slots[slot]
 
+    def get_all_bonuses(self) -> Tuple[int, int, int, int]:
+        """
+        Calculate all stat bonuses from equipment in one pass.
+
+        Totals are cached until the next equip or unequip.
+
+        Returns:
+            Tuple of (damage, defense, health, stamina) bonuses
+        """
+        if self._bonus_cache is None:
+            damage = defense = health = stamina = 0
+            for item in self.slots.values():
+                if item:
+                    damage += item.damage_bonus
+                    defense += item.defense_bonus
+                    health += item.health_bonus
+                    stamina += item.stamina_bonus
+            self._bonus_cache = (damage, defense, health, stamina)
+        return self._bonus_cache
+
     def get_total_damage_bonus(self) -> int:
         """Calculate total damage bonus from all equipment."""
-        total = 0
-        for item in self.slots.values():
-            if item:
-                total += item.damage_bonus
-        return total
+        return self.get_all_bonuses()[0]
 
     def get_total_defense_bonus(self) -> int:
         """Calculate total defense bonus from all equipment."""
-        total = 0
-        for item in self.slots.values():
-            if item:
-                total += item.defense_bonus
-        return total
+        return self.get_all_bonuses()[1]
 
     def get_total_health_bonus(self) -> int:
         """Calculate total health bonus from all equipment."""
-        total = 0
-        for item in self.slots.values():
-            if item:
-                total += item.health_bonus
-        return total
+        return self.get_all_bonuses()[2]
 
     def get_total_stamina_bonus(self) -> int:
         """Calculate total stamina bonus from all equipment."""
-        total = 0
-        for item in self.slots.values():
-            if item:
-                total += item.stamina_bonus
-        return total
+        return self.get_all_bonuses()[3]
 
     def get_all_equipped(self) -> Dict[EquipmentSlot, EquipmentItem]:
         """Get all currently equipped items."""
@@ -11,7 +11,7 @@ from world_gen.chunk_manager import ChunkManager
 from world_gen.biome import BiomeManager
 from world_gen.vegetation import VegetationManager
 from world_gen.poi_generator import POIGenerator, POIType
-from game.poi_marker import POIMarker
+from game.poi_marker import POIMarker, POIMarkerManager
 from game.pathfinding import NavigationGrid
 from typing import List, Optional
 
@@ -70,10 +70,10 @@ class GameWorld:
         logger.info(f"Generated {len(self.poi_generator.pois)} Points of Interest")
 
         # Create visual markers for all POIs
-        self.poi_markers: List[POIMarker] = []
+        self.poi_marker_manager = POIMarkerManager()
         for poi in self.poi_generator.pois:
-            marker = POIMarker(poi)
-            self.poi_markers.append(marker)
+            self.poi_marker_manager.add_marker(POIMarker(poi))
+        self.poi_markers: List[POIMarker] = self.poi_marker_manager.markers
         logger.info(f"Created {len(self.poi_markers)} POI markers")
 
         # Setup NPCs, merchants, fast travel points, and dungeon bosses in the world
@@ -208,8 +208,7 @@ class GameWorld:
             entity.update(delta_time)
 
         # Update POI markers
-        for marker in self.poi_markers:
-            marker.update(delta_time)
+        self.poi_marker_manager.update_all(delta_time)
 
         # Update NPCs
         self.npc_manager.update_all(delta_time, player_position)
@@ -1,6 +1,7 @@
 """Object interaction system."""
 import glm
 from game.logger import get_logger
+from game.puzzles import PuzzleState
 
 logger = get_logger(__name__)
 
@@ -123,7 +124,7 @@ class InteractionSystem:
                 # Update journal for door openings
                 if self.journal and 'door' in entity_type:
                     puzzle_obj = self.journal.get_objective("solve_puzzles")
-                    if puzzle_obj and hasattr(self.looking_at, 'state') and self.looking_at.state == "open":
+                    if puzzle_obj and hasattr(self.looking_at, 'state') and self.looking_at.state == PuzzleState.OPEN:
                         # Map door names to sub-task indices
                         door_task_map = {
                             "Main Door": 0,
@@ -1,4 +1,5 @@
 """Inventory system for tracking collected items."""
+import logging
 from typing import List, Optional, Dict
 from game.equipment import EquipmentItem, EquipmentSlot, ItemRarity
 from game.logger import get_logger
@@ -50,7 +51,8 @@ class Inventory:
         else:
             self.materials[item_id] = quantity
 
-        logger.debug(f"Added {quantity}x {item_id} to materials")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Added {quantity}x {item_id} to materials")
         return True
 
     def remove_material(self, item_id: str, quantity: int = 1) -> bool:
@@ -74,7 +76,8 @@ class Inventory:
         if self.materials[item_id] <= 0:
             del self.materials[item_id]
 
-        logger.debug(f"Removed {quantity}x {item_id} from materials")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Removed {quantity}x {item_id} from materials")
         return True
 
     def get_item_count(self, item_id: str) -> int:
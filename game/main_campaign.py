@@ -8,6 +8,33 @@ from game.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Campaign quests that only unlock once several other quests are completed.
+# Maps quest_id -> quest IDs that must all complete before it auto-starts.
+_PREREQUISITES = {
+    "main_8_final_boss": frozenset({"main_6_crystal_caves", "main_7_ancient_shrine"}),
+}
+
+
+def _build_unlocks(prerequisites):
+    """Invert a prerequisite table into quest_id -> quests waiting on it."""
+    unlocks = {}
+    for child_id, prereq_ids in prerequisites.items():
+        for prereq_id in prereq_ids:
+            unlocks.setdefault(prereq_id, []).append(child_id)
+    return unlocks
+
+
+_UNLOCKS = _build_unlocks(_PREREQUISITES)
+
+_CAMPAIGN_COMPLETE_BANNER = "\n".join([
+    "=" * 60,
+    "CONGRATULATIONS!",
+    "You have completed the main campaign!",
+    "The Awakening of the Ancient Guardians",
+    "=" * 60,
+    "Continue exploring to find hidden secrets and challenges!",
+])
+
 
 class MainCampaign:
     """
@@ -20,6 +47,8 @@ class MainCampaign:
     power and allies, to confront the source of the corruption and restore balance.
     """
 
+    __slots__ = ("quest_manager", "player", "campaign_quests", "_remaining_prereqs")
+
     def __init__(self, quest_manager, player):
         """
         Initialize the main campaign.
@@ -32,6 +61,9 @@ class MainCampaign:
         self.player = player
         self.campaign_quests = []
 
+        # Outstanding prerequisite count per gated quest
+        self._remaining_prereqs = {qid: len(p) for qid, p in _PREREQUISITES.items()}
+
         # Create all campaign quests
         self._create_campaign_quests()
 
@@ -39,37 +71,19 @@ class MainCampaign:
 
     def _create_campaign_quests(self):
         """Create all main campaign quests."""
-        # Quest 1: The Awakening
-        q1 = self._create_quest_awakening()
-        self.campaign_quests.append(q1.quest_id)
-
-        # Quest 2: First Blood
-        q2 = self._create_quest_first_blood()
-        self.campaign_quests.append(q2.quest_id)
-
-        # Quest 3: The Village Elder
-        q3 = self._create_quest_village_elder()
-        self.campaign_quests.append(q3.quest_id)
-
-        # Quest 4: Gathering Strength
-        q4 = self._create_quest_gathering_strength()
-        self.campaign_quests.append(q4.quest_id)
-
-        # Quest 5: The Corrupted Woods
-        q5 = self._create_quest_corrupted_woods()
-        self.campaign_quests.append(q5.quest_id)
-
-        # Quest 6: Crystal Caves Expedition
-        q6 = self._create_quest_crystal_caves()
-        self.campaign_quests.append(q6.quest_id)
-
-        # Quest 7: The Ancient Shrine
-        q7 = self._create_quest_ancient_shrine()
-        self.campaign_quests.append(q7.quest_id)
-
-        # Quest 8: Final Confrontation
-        q8 = self._create_quest_final_boss()
-        self.campaign_quests.append(q8.quest_id)
+        quests = [
+            self._create_quest_awakening(),           # Quest 1: The Awakening
+            self._create_quest_first_blood(),         # Quest 2: First Blood
+            self._create_quest_village_elder(),       # Quest 3: The Village Elder
+            self._create_quest_gathering_strength(),  # Quest 4: Gathering Strength
+            self._create_quest_corrupted_woods(),     # Quest 5: The Corrupted Woods
+            self._create_quest_crystal_caves(),       # Quest 6: Crystal Caves Expedition
+            self._create_quest_ancient_shrine(),      # Quest 7: The Ancient Shrine
+            self._create_quest_final_boss(),          # Quest 8: Final Confrontation
+        ]
+
+        self.quest_manager.register_quests(quests)
+        self.campaign_quests.extend(quest.quest_id for quest in quests)
 
     def _create_quest_awakening(self) -> Quest:
         """Quest 1: The Awakening - Tutorial quest."""
@@ -113,7 +127,6 @@ class MainCampaign:
         quest.reward_func = lambda: self._reward_awakening()
         quest.on_complete = lambda: self._on_awakening_complete()
 
-        self.quest_manager.register_quest(quest)
         return quest
 
     def _create_quest_first_blood(self) -> Quest:
@@ -147,7 +160,6 @@ class MainCampaign:
         quest.reward_func = lambda: self._reward_first_blood()
         quest.on_complete = lambda: self._on_first_blood_complete()
 
-        self.quest_manager.register_quest(quest)
         return quest
 
     def _create_quest_village_elder(self) -> Quest:
@@ -181,7 +193,6 @@ class MainCampaign:
         quest.reward_func = lambda: self._reward_village_elder()
         quest.on_complete = lambda: self._on_village_elder_complete()
 
-        self.quest_manager.register_quest(quest)
         return quest
 
     def _create_quest_gathering_strength(self) -> Quest:
@@ -225,7 +236,6 @@ class MainCampaign:
         quest.reward_func = lambda: self._reward_gathering_strength()
         quest.on_complete = lambda: self._on_gathering_strength_complete()
 
-        self.quest_manager.register_quest(quest)
         return quest
 
     def _create_quest_corrupted_woods(self) -> Quest:
@@ -268,7 +278,6 @@ class MainCampaign:
         quest.reward_func = lambda: self._reward_corrupted_woods()
         quest.on_complete = lambda: self._on_corrupted_woods_complete()
 
-        self.quest_manager.register_quest(quest)
         return quest
 
     def _create_quest_crystal_caves(self) -> Quest:
@@ -311,7 +320,6 @@ class MainCampaign:
         quest.reward_func = lambda: self._reward_crystal_caves()
         quest.on_complete = lambda: self._on_crystal_caves_complete()
 
-        self.quest_manager.register_quest(quest)
         return quest
 
     def _create_quest_ancient_shrine(self) -> Quest:
@@ -345,7 +353,6 @@ class MainCampaign:
         quest.reward_func = lambda: self._reward_ancient_shrine()
         quest.on_complete = lambda: self._on_ancient_shrine_complete()
 
-        self.quest_manager.register_quest(quest)
         return quest
 
     def _create_quest_final_boss(self) -> Quest:
@@ -389,7 +396,6 @@ class MainCampaign:
         quest.reward_func = lambda: self._reward_final_boss()
         quest.on_complete = lambda: self._on_campaign_complete()
 
-        self.quest_manager.register_quest(quest)
         return quest
 
     # ===== Reward Functions =====
@@ -498,29 +504,36 @@ class MainCampaign:
         """Called when Crystal Caves Expedition completes."""
         logger.info("Quest Complete: Crystal Caves Expedition")
         logger.info("You have harnessed the power of ancient crystals!")
-        self._check_final_quest_unlock()
+        self._resolve_prerequisite("main_6_crystal_caves")
 
     def _on_ancient_shrine_complete(self):
         """Called when The Ancient Shrine completes."""
         logger.info("Quest Complete: The Ancient Shrine")
         logger.info("The shrines reveal the location of the corruption's source...")
-        self._check_final_quest_unlock()
+        self._resolve_prerequisite("main_7_ancient_shrine")
 
-    def _check_final_quest_unlock(self):
-        """Check if both prerequisite quests are done to unlock final quest."""
-        if (self.quest_manager.is_quest_completed("main_6_crystal_caves") and
-            self.quest_manager.is_quest_completed("main_7_ancient_shrine")):
-            logger.info("You are ready for the final confrontation!")
-            self.quest_manager.start_quest("main_8_final_boss")
+    def _resolve_prerequisite(self, quest_id):
+        """
+        Count a completed quest towards every gated quest that depends on it.
+
+        Gated quests auto-start once their last prerequisite completes.
+
+        Args:
+            quest_id: ID of the quest that just completed
+        """
+        for child_id in _UNLOCKS.get(quest_id, ()):
+            remaining = self._remaining_prereqs.get(child_id, 0)
+            if remaining <= 0:
+                continue
+            remaining -= 1
+            self._remaining_prereqs[child_id] = remaining
+            if remaining == 0:
+                logger.info("You are ready for the final confrontation!")
+                self.quest_manager.start_quest(child_id)
 
     def _on_campaign_complete(self):
         """Called when the entire campaign completes."""
-        logger.info("=" * 60)
-        logger.info("CONGRATULATIONS!")
-        logger.info("You have completed the main campaign!")
-        logger.info("The Awakening of the Ancient Guardians")
-        logger.info("=" * 60)
-        logger.info("Continue exploring to find hidden secrets and challenges!")
+        logger.info(_CAMPAIGN_COMPLETE_BANNER)
 
     # ===== Campaign Management =====
 
@@ -537,14 +550,9 @@ class MainCampaign:
             dict: Progress information
         """
         total_quests = len(self.campaign_quests)
-        completed_count = sum(
-            1 for qid in self.campaign_quests
-            if self.quest_manager.is_quest_completed(qid)
-        )
-        active_count = sum(
-            1 for qid in self.campaign_quests
-            if self.quest_manager.is_quest_active(qid)
-        )
+        # Set intersections count membership in C rather than a Python loop
+        completed_count = len(self.quest_manager.completed_quests.intersection(self.campaign_quests))
+        active_count = len(self.quest_manager.active_quests.intersection(self.campaign_quests))
 
         return {
             "total_quests": total_quests,
@@ -556,7 +564,4 @@ class MainCampaign:
 
     def is_campaign_complete(self) -> bool:
         """Check if the entire campaign is complete."""
-        return all(
-            self.quest_manager.is_quest_completed(qid)
-            for qid in self.campaign_quests
-        )
+        return self.quest_manager.completed_quests.issuperset(self.campaign_quests)
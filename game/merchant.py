@@ -1,24 +1,60 @@
 """Merchant system for buying and selling items."""
+from array import array
 from typing import List, Dict, Optional
-from game.equipment import EquipmentItem, EquipmentSlot, ItemRarity
+from game.equipment import EquipmentGenerator, EquipmentItem, EquipmentSlot, ItemRarity
 import random
 
+# Price multiplier per item rarity
+RARITY_PRICE_MULTIPLIERS = {
+    ItemRarity.COMMON: 1.0,
+    ItemRarity.UNCOMMON: 2.0,
+    ItemRarity.RARE: 4.0,
+    ItemRarity.EPIC: 8.0,
+    ItemRarity.LEGENDARY: 16.0,
+}
+
+# Slots a general merchant picks from
+_ALL_SLOTS = tuple(EquipmentSlot)
+
+# Rarities merchants stock, with cumulative weights (50/30/15/5)
+_STOCK_RARITIES = (ItemRarity.COMMON, ItemRarity.UNCOMMON, ItemRarity.RARE, ItemRarity.EPIC)
+_STOCK_RARITY_CUM_WEIGHTS = (50, 80, 95, 100)
+
+
+def get_item_value(item: EquipmentItem) -> float:
+    """
+    Get an item's base trade value from its level and rarity.
+
+    Args:
+        item: Item to value
+
+    Returns:
+        Value in gold before merchant price modifiers
+    """
+    return item.level_required * 10 * RARITY_PRICE_MULTIPLIERS[item.rarity]
+
 
 class MerchantInventory:
     """Represents a merchant's stock of items for sale."""
 
-    def __init__(self, merchant_type: str = "general", level_range: tuple = (1, 5)):
+    __slots__ = ("merchant_type", "level_range", "rng", "items", "prices", "_item_index")
+
+    def __init__(self, merchant_type: str = "general", level_range: tuple = (1, 5),
+                 seed: Optional[int] = None):
         """
         Initialize merchant inventory.
 
         Args:
             merchant_type: Type of merchant (general, weapons, armor, potions)
             level_range: Min/max item level to stock
+            seed: Optional random seed for deterministic stock
         """
         self.merchant_type = merchant_type
         self.level_range = level_range
+        self.rng = random.Random(seed)
         self.items: List[EquipmentItem] = []
-        self.prices: Dict[str, int] = {}  # item_id -> price
+        self.prices = array('i')  # Sell price of each item, parallel to items
+        self._item_index: Dict[str, int] = {}  # item_id -> position in items
 
         # Generate initial stock
         self.restock()
@@ -26,31 +62,39 @@ class MerchantInventory:
     def restock(self):
         """Generate new merchant inventory."""
         self.items.clear()
-        self.prices.clear()
+        del self.prices[:]
+        self._item_index.clear()
+
+        rng = self.rng
+        generator = EquipmentGenerator()
 
         # Number of items to stock
-        item_count = random.randint(5, 10)
+        item_count = rng.randint(5, 10)
 
-        for _ in range(item_count):
-            item = self._generate_merchant_item()
+        # Draw levels and rarities for the whole batch up front
+        min_level, max_level = self.level_range
+        levels = [rng.randint(min_level, max_level) for _ in range(item_count)]
+        rarities = rng.choices(_STOCK_RARITIES, cum_weights=_STOCK_RARITY_CUM_WEIGHTS, k=item_count)
+
+        for level, rarity in zip(levels, rarities):
+            item = self._generate_merchant_item(generator, level, rarity)
             if item:
-                self.items.append(item)
                 # Price is based on item level and rarity
-                base_price = item.level_required * 10
-                rarity_mult = {
-                    ItemRarity.COMMON: 1.0,
-                    ItemRarity.UNCOMMON: 2.0,
-                    ItemRarity.RARE: 4.0,
-                    ItemRarity.EPIC: 8.0,
-                    ItemRarity.LEGENDARY: 16.0
-                }
-                price = int(base_price * rarity_mult[item.rarity])
-                self.prices[item.id] = price
-
-    def _generate_merchant_item(self) -> Optional[EquipmentItem]:
-        """Generate a random item for merchant stock."""
-        from game.equipment import EquipmentGenerator
+                self.add_item(item, int(get_item_value(item)))
+
+    def _generate_merchant_item(self, generator, level: int,
+                                rarity: ItemRarity) -> Optional[EquipmentItem]:
+        """
+        Generate a random item for merchant stock.
+
+        Args:
+            generator: EquipmentGenerator shared across the restock
+            level: Item level
+            rarity: Item rarity
 
+        Returns:
+            Generated item
+        """
         # Determine slot based on merchant type
         if self.merchant_type == "weapons":
             slot = EquipmentSlot.WEAPON
@@ -59,37 +103,68 @@ class MerchantInventory:
         elif self.merchant_type == "accessories":
             slot = EquipmentSlot.ACCESSORY
         else:  # general
-            slot = random.choice(list(EquipmentSlot))
+            slot = self.rng.choice(_ALL_SLOTS)
 
-        level = random.randint(self.level_range[0], self.level_range[1])
-        rarity = random.choices(
-            [ItemRarity.COMMON, ItemRarity.UNCOMMON, ItemRarity.RARE, ItemRarity.EPIC],
-            weights=[50, 30, 15, 5],
-            k=1
-        )[0]
-
-        generator = EquipmentGenerator()
         return generator.generate_random_item(slot, level, rarity)
 
+    def add_item(self, item: EquipmentItem, price: int):
+        """
+        Add an item to merchant stock.
+
+        Args:
+            item: Item to stock
+            price: Price the merchant sells it for
+        """
+        self._item_index[item.id] = len(self.items)
+        self.items.append(item)
+        self.prices.append(price)
+
+    def get_item(self, item_id: str) -> Optional[EquipmentItem]:
+        """Get a stocked item by ID."""
+        index = self._item_index.get(item_id)
+        return self.items[index] if index is not None else None
+
     def get_item_price(self, item_id: str) -> int:
         """Get the price of an item."""
-        return self.prices.get(item_id, 0)
+        index = self._item_index.get(item_id)
+        return self.prices[index] if index is not None else 0
 
     def has_item(self, item_id: str) -> bool:
         """Check if merchant has an item in stock."""
-        return any(item.id == item_id for item in self.items)
+        return item_id in self._item_index
 
     def remove_item(self, item_id: str) -> Optional[EquipmentItem]:
         """Remove and return an item from merchant stock."""
-        for i, item in enumerate(self.items):
-            if item.id == item_id:
-                return self.items.pop(i)
-        return None
+        index = self._item_index.pop(item_id, None)
+        if index is None:
+            return None
+
+        # Stock order doesn't matter, so fill the gap with the last item
+        items = self.items
+        prices = self.prices
+        item = items[index]
+        last = items.pop()
+        last_price = prices.pop()
+        if last is not item:
+            items[index] = last
+            prices[index] = last_price
+            self._item_index[last.id] = index
+        return item
 
 
 class Merchant:
     """Represents a merchant NPC that can buy and sell items."""
 
+    __slots__ = ("name", "merchant_type", "inventory", "gold", "buy_price_modifier",
+                 "sell_price_modifier", "greetings")
+
+    # Farewells are the same for every merchant
+    FAREWELLS = (
+        "Come back anytime!",
+        "Safe travels!",
+        "May fortune favor you!",
+    )
+
     def __init__(self, name: str, merchant_type: str = "general", level_range: tuple = (1, 5)):
         """
         Initialize merchant.
@@ -107,16 +182,11 @@ class Merchant:
         self.sell_price_modifier = 1.0  # Merchant sells at full price
 
         # Dialogue
-        self.greetings = [
+        self.greetings = (
             f"Welcome to my shop! I'm {name}.",
             f"Greetings, traveler! {name} at your service.",
-            f"Looking to trade? You've come to the right place!",
-        ]
-        self.farewells = [
-            "Come back anytime!",
-            "Safe travels!",
-            "May fortune favor you!",
-        ]
+            "Looking to trade? You've come to the right place!",
+        )
 
     def get_greeting(self) -> str:
         """Get a random greeting."""
@@ -124,7 +194,7 @@ class Merchant:
 
     def get_farewell(self) -> str:
         """Get a random farewell."""
-        return random.choice(self.farewells)
+        return random.choice(self.FAREWELLS)
 
     def get_sell_price(self, item: EquipmentItem) -> int:
         """
@@ -136,19 +206,11 @@ class Merchant:
         Returns:
             Price in gold
         """
-        if item.id in self.inventory.prices:
-            return self.inventory.prices[item.id]
+        if self.inventory.has_item(item.id):
+            return self.inventory.get_item_price(item.id)
 
         # Calculate base price
-        base_price = item.level_required * 10
-        rarity_mult = {
-            ItemRarity.COMMON: 1.0,
-            ItemRarity.UNCOMMON: 2.0,
-            ItemRarity.RARE: 4.0,
-            ItemRarity.EPIC: 8.0,
-            ItemRarity.LEGENDARY: 16.0
-        }
-        return int(base_price * rarity_mult[item.rarity] * self.sell_price_modifier)
+        return int(get_item_value(item) * self.sell_price_modifier)
 
     def get_buy_price(self, item: EquipmentItem) -> int:
         """
@@ -179,12 +241,7 @@ class Merchant:
             Tuple of (success, message, item)
         """
         # Find item in merchant inventory
-        item = None
-        for inv_item in self.inventory.items:
-            if inv_item.id == item_id:
-                item = inv_item
-                break
-
+        item = self.inventory.get_item(item_id)
         if not item:
             return False, "That item is not available.", None
 
@@ -210,7 +267,8 @@ class Merchant:
         Returns:
             Tuple of (success, message, gold_earned)
         """
-        price = self.get_buy_price(item)
+        sell_price = self.get_sell_price(item)
+        price = int(sell_price * self.buy_price_modifier)
 
         # Check if merchant can afford
         if not self.can_afford(price):
@@ -218,8 +276,7 @@ class Merchant:
 
         # Complete transaction
         self.gold -= price
-        self.inventory.items.append(item)
-        self.inventory.prices[item.id] = self.get_sell_price(item)
+        self.inventory.add_item(item, sell_price)
 
         return True, f"Bought {item.name} for {price} gold.", price
 
@@ -227,6 +284,8 @@ class Merchant:
 class MerchantManager:
     """Manages all merchants in the game."""
 
+    __slots__ = ("merchants",)
+
     def __init__(self):
         """Initialize merchant manager."""
         self.merchants: Dict[str, Merchant] = {}
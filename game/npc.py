@@ -1,10 +1,17 @@
 """NPC (Non-Player Character) system with AI behaviors."""
+import math
 import glm
-import numpy as np
 from enum import Enum
 from game.entities import Entity
 import config
 
+# NPC transform constants (the NPC scale never changes at runtime)
+_UP = glm.vec3(0.0, 1.0, 0.0)
+_SCALE_MATRIX = glm.scale(glm.mat4(1.0), glm.vec3(*config.NPC_SCALE))
+# Model matrix upper 3x3 is R * S, so the normal matrix (R * S^-1) is that times S^-2
+_INV_SCALE_SQ_MATRIX = glm.mat3(glm.scale(glm.mat4(1.0), 1.0 / (glm.vec3(*config.NPC_SCALE) ** 2)))
+_SLEEP_DISTANCE_SQ = config.NPC_SLEEP_DISTANCE * config.NPC_SLEEP_DISTANCE
+
 
 class NPCState(Enum):
     """NPC AI states."""
@@ -69,12 +76,6 @@ class NPC(Entity):
         self.animation_time = 0.0
         self.bob_height = 0.0  # Subtle bobbing animation
 
-        # Cached matrices for performance (avoid recalculating every frame)
-        self._cached_model_matrix = None
-        self._cached_normal_matrix = None
-        self._last_position = None
-        self._last_rotation_y = None
-
     def set_patrol_points(self, points):
         """
         Set patrol points for patrol behavior.
@@ -98,8 +99,22 @@ class NPC(Entity):
         self.animation_time += delta_time
         self.patrol_timer -= delta_time
 
-        # Subtle bobbing animation
-        self.bob_height = np.sin(self.animation_time * config.NPC_BOB_SPEED) * config.NPC_BOB_HEIGHT
+        # Idle NPCs far from the player have nothing to react to; keep the
+        # clock running but skip AI, bobbing and matrix rebuilds
+        if self.state == NPCState.IDLE and player_position is not None:
+            dx = player_position.x - self.position.x
+            dz = player_position.z - self.position.z
+            if dx * dx + dz * dz > _SLEEP_DISTANCE_SQ:
+                # Still coast to a stop if the NPC went idle while moving
+                velocity = self.velocity
+                if velocity.x or velocity.y or velocity.z:
+                    self.position += velocity * delta_time
+                    self.velocity *= 0.9
+                return
+
+        # Subtle bobbing animation (moves the render position every frame)
+        self.bob_height = math.sin(self.animation_time * config.NPC_BOB_SPEED) * config.NPC_BOB_HEIGHT
+        self._matrix_dirty = True
 
         # Update based on state
         if self.state == NPCState.IDLE:
@@ -127,8 +142,8 @@ class NPC(Entity):
         """Update idle behavior - just stand there."""
         if player_position:
             # Face towards player if nearby
-            distance = glm.length(player_position - self.position)
-            if distance < self.interaction_range * 2:
+            face_range = self.interaction_range * 2
+            if glm.distance2(player_position, self.position) < face_range * face_range:
                 self._face_towards(player_position)
 
     def _update_patrol(self, delta_time):
@@ -140,10 +155,10 @@ class NPC(Entity):
         # Get current target
         target = self.patrol_points[self.current_patrol_index]
         direction = target - self.position
-        distance = glm.length(direction)
+        distance_sq = glm.length2(direction)
 
         # Reached patrol point
-        if distance < 0.5:
+        if distance_sq < 0.25:  # Within 0.5 units
             if self.patrol_timer <= 0:
                 # Move to next patrol point
                 self.current_patrol_index = (self.current_patrol_index + 1) % len(self.patrol_points)
@@ -152,7 +167,7 @@ class NPC(Entity):
             self.velocity = glm.vec3(0.0, 0.0, 0.0)
         else:
             # Move towards patrol point
-            if distance > 0:
+            if distance_sq > 0:
                 direction = glm.normalize(direction)
                 self.velocity = direction * self.speed
                 self._face_towards(target)
@@ -171,11 +186,10 @@ class NPC(Entity):
             return
 
         direction = player_position - self.position
-        distance = glm.length(direction)
 
         # Keep some distance from player
         follow_distance = 3.0
-        if distance > follow_distance:
+        if glm.length2(direction) > follow_distance * follow_distance:
             direction = glm.normalize(direction)
             self.velocity = direction * self.speed
             self._face_towards(player_position)
@@ -189,11 +203,11 @@ class NPC(Entity):
             return
 
         direction = self.position - player_position  # Opposite direction
-        distance = glm.length(player_position - self.position)
+        distance_sq = glm.length2(direction)
 
         # Only flee if player is nearby
-        if distance < 10.0:
-            if glm.length(direction) > 0:
+        if distance_sq < 100.0:  # Within 10 units
+            if distance_sq > 0:
                 direction = glm.normalize(direction)
                 self.velocity = direction * self.speed * 1.5  # Flee faster
         else:
@@ -206,10 +220,11 @@ class NPC(Entity):
         Args:
             target_position: Position to face (glm.vec3)
         """
-        direction = target_position - self.position
-        if glm.length(glm.vec2(direction.x, direction.z)) > 0.01:
-            angle = np.arctan2(direction.x, direction.z)
-            self.rotation.y = -np.degrees(angle)
+        dx = target_position.x - self.position.x
+        dz = target_position.z - self.position.z
+        if dx * dx + dz * dz > 0.0001:  # Farther than 0.01 on the XZ plane
+            self.rotation.y = -math.degrees(math.atan2(dx, dz))
+            self._matrix_dirty = True  # In-place edit bypasses the rotation setter
 
     def can_interact(self, player_position, current_time):
         """
@@ -222,9 +237,9 @@ class NPC(Entity):
         Returns:
             bool: True if interaction is possible
         """
-        distance = glm.length(player_position - self.position)
+        distance_sq = glm.distance2(player_position, self.position)
         cooldown_ok = (current_time - self.last_interaction_time) > self.interaction_cooldown
-        return distance < self.interaction_range and cooldown_ok
+        return distance_sq < self.interaction_range * self.interaction_range and cooldown_ok
 
     def start_interaction(self, current_time):
         """Start interacting with this NPC."""
@@ -250,22 +265,14 @@ class NPC(Entity):
         Returns:
             glm.mat4: Model matrix with translation, rotation, and scale
         """
-        # Check if we need to recalculate (position or rotation changed)
-        current_pos = self.get_render_position()
-        if (self._cached_model_matrix is None or
-            self._last_position != current_pos or
-            self._last_rotation_y != self.rotation.y):
-
-            # Recalculate model matrix
-            model = glm.mat4(1.0)
-            model = glm.translate(model, current_pos)
-            model = glm.rotate(model, glm.radians(self.rotation.y), glm.vec3(0, 1, 0))
-            model = glm.scale(model, glm.vec3(*config.NPC_SCALE))
+        # Recalculate only when update() or a transform setter marked us dirty
+        if self._matrix_dirty or self._cached_model_matrix is None:
+            model = glm.translate(glm.mat4(1.0), self.get_render_position())
+            model = glm.rotate(model, glm.radians(self.rotation.y), _UP) * _SCALE_MATRIX
 
             # Cache it
             self._cached_model_matrix = model
-            self._last_position = current_pos
-            self._last_rotation_y = self.rotation.y
+            self._matrix_dirty = False
 
             # Invalidate normal matrix cache
             self._cached_normal_matrix = None
@@ -279,11 +286,11 @@ class NPC(Entity):
         Returns:
             glm.mat3: Normal matrix for transforming normals
         """
+        # Ensure model matrix is up to date (clears a stale normal matrix)
+        model = self.get_model_matrix()
         if self._cached_normal_matrix is None:
-            # Ensure model matrix is up to date
-            model = self.get_model_matrix()
-            # Calculate normal matrix
-            self._cached_normal_matrix = glm.mat3(glm.transpose(glm.inverse(model)))
+            # Closed form of transpose(inverse(model)) for rotation + scale
+            self._cached_normal_matrix = glm.mat3(model) * _INV_SCALE_SQ_MATRIX
 
         return self._cached_normal_matrix
 
@@ -352,14 +359,13 @@ class NPCManager:
             NPC or None
         """
         closest_npc = None
-        closest_distance = float('inf')
+        closest_distance_sq = float('inf')
 
         for npc in self.npcs_list:
-            if npc.can_interact(player_position, current_time):
-                distance = glm.length(player_position - npc.position)
-                if distance < closest_distance:
-                    closest_distance = distance
-                    closest_npc = npc
+            distance_sq = glm.distance2(player_position, npc.position)
+            if distance_sq < closest_distance_sq and npc.can_interact(player_position, current_time):
+                closest_distance_sq = distance_sq
+                closest_npc = npc
 
         return closest_npc
 
@@ -2,13 +2,25 @@
 import numpy as np
 from numba import njit
 import glm
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
+# Cost of a diagonal grid step (straight steps cost 1.0)
+DIAGONAL_COST = 1.414  # sqrt(2)
 
-@njit(fastmath=True)
+# 8-directional neighbour offsets and step costs, in sorted (dx, dz) order
+# skipping (0, 0): (-1,-1), (-1,0), (-1,1), (0,-1), (0,1), (1,-1), (1,0), (1,1)
+_NEIGHBOR_DX = (-1, -1, -1, 0, 0, 1, 1, 1)
+_NEIGHBOR_DZ = (-1, 0, 1, -1, 1, -1, 0, 1)
+_NEIGHBOR_COST = (DIAGONAL_COST, 1.0, DIAGONAL_COST, 1.0, 1.0, DIAGONAL_COST, 1.0, DIAGONAL_COST)
+
+# Maximum number of grid paths NavigationGrid remembers
+PATH_CACHE_SIZE = 256
+
+
+@njit(fastmath=True, cache=True)
 def heuristic(a_x, a_z, b_x, b_z):
     """
-    Calculate heuristic (Manhattan distance).
+    Calculate heuristic (octile distance for 8-directional movement).
 
     Args:
         a_x, a_z: Position A
@@ -17,86 +29,121 @@ def heuristic(a_x, a_z, b_x, b_z):
     Returns:
         float: Estimated distance
     """
-    return abs(a_x - b_x) + abs(a_z - b_z)
+    dx = abs(a_x - b_x)
+    dz = abs(a_z - b_z)
+    return (dx + dz) + (DIAGONAL_COST - 2.0) * min(dx, dz)
 
 
-@njit(fastmath=True)
-def get_neighbors(x, z, width, height):
+@njit(fastmath=True, cache=True)
+def reconstruct_path(came_from, goal_index, width, max_length=1000):
     """
-    Get valid neighbor cells (8-directional movement).
+    Reconstruct path from the came_from parent array.
 
     Args:
-        x, z: Current cell position
-        width, height: Grid dimensions
+        came_from: Parent cell index of each cell (z * width + x), -1 for none
+        goal_index: Linear index of the goal cell
+        width: Grid width, used to unpack indices into (x, z)
+        max_length: Maximum path length
 
     Returns:
-        Array of neighbor positions (Nx2)
+        Array of path positions (Nx2)
     """
-    neighbors = []
+    path = np.empty((max_length, 2), dtype=np.int32)
+    path_length = 0
 
-    # 8 directions (N, S, E, W, NE, NW, SE, SW)
-    for dx in range(-1, 2):
-        for dz in range(-1, 2):
-            if dx == 0 and dz == 0:
-                continue
+    index = goal_index
+    while path_length < max_length:
+        path[path_length, 0] = index % width
+        path[path_length, 1] = index // width
+        path_length += 1
 
-            nx = x + dx
-            nz = z + dz
+        # Trace back through parents until the start (no parent)
+        index = came_from[index]
+        if index == -1:
+            break
 
-            if 0 <= nx < width and 0 <= nz < height:
-                neighbors.append((nx, nz))
+    # Reverse path (currently goes from goal to start)
+    result = np.empty((path_length, 2), dtype=np.int32)
+    for i in range(path_length):
+        result[i] = path[path_length - 1 - i]
 
-    return neighbors
+    return result
 
 
-@njit(fastmath=True)
-def reconstruct_path(came_from, current_x, current_z, max_length=1000):
+@njit(fastmath=True, cache=True)
+def _heap_push(heap_f, heap_node, size, f_score, node):
     """
-    Reconstruct path from came_from dictionary.
+    Push a node onto the open-set binary min-heap.
 
     Args:
-        came_from: 2D array storing parent cells
-        current_x, current_z: Goal position
-        max_length: Maximum path length
+        heap_f: f_score of each heap entry
+        heap_node: Linear cell index of each heap entry
+        size: Current number of entries
+        f_score: f_score of the new node
+        node: Linear cell index of the new node
 
     Returns:
-        Array of path positions (Nx2)
+        int: New heap size
     """
-    path = np.empty((max_length, 2), dtype=np.int32)
-    path_length = 0
+    # Sift up from the end
+    i = size
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap_f[parent] <= f_score:
+            break
+        heap_f[i] = heap_f[parent]
+        heap_node[i] = heap_node[parent]
+        i = parent
 
-    x, z = current_x, current_z
-    path[path_length] = (x, z)
-    path_length += 1
+    heap_f[i] = f_score
+    heap_node[i] = node
+    return size + 1
 
-    # Trace back through parents
-    while path_length < max_length:
-        parent_x = came_from[x, z, 0]
-        parent_z = came_from[x, z, 1]
 
-        # Reached start (no parent)
-        if parent_x == -1 and parent_z == -1:
-            break
+@njit(fastmath=True, cache=True)
+def _heap_pop(heap_f, heap_node, size):
+    """
+    Remove the lowest f_score node from the open-set binary min-heap.
 
-        x, z = parent_x, parent_z
-        path[path_length] = (x, z)
-        path_length += 1
+    Args:
+        heap_f: f_score of each heap entry
+        heap_node: Linear cell index of each heap entry
+        size: Current number of entries (must be > 0)
 
-    # Reverse path (currently goes from goal to start)
-    result = np.empty((path_length, 2), dtype=np.int32)
-    for i in range(path_length):
-        result[i] = path[path_length - 1 - i]
+    Returns:
+        Tuple of (node, new_size)
+    """
+    node = heap_node[0]
+
+    # Sift the last entry down from the root
+    size -= 1
+    last_f = heap_f[size]
+    last_node = heap_node[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap_f[child + 1] < heap_f[child]:
+            child += 1
+        if last_f <= heap_f[child]:
+            break
+        heap_f[i] = heap_f[child]
+        heap_node[i] = heap_node[child]
+        i = child
 
-    return result
+    heap_f[i] = last_f
+    heap_node[i] = last_node
+    return node, size
 
 
-@njit(fastmath=True)
+@njit(fastmath=True, cache=True)
 def astar_search(grid, start_x, start_z, goal_x, goal_z):
     """
     A* pathfinding algorithm (Numba-optimized).
 
     Args:
-        grid: 2D array (0 = walkable, 1 = blocked)
+        grid: 2D array indexed [z, x] (0 = walkable, nonzero = blocked)
         start_x, start_z: Start position
         goal_x, goal_z: Goal position
 
@@ -110,98 +157,78 @@ def astar_search(grid, start_x, start_z, goal_x, goal_z):
         return np.empty((0, 2), dtype=np.int32)
     if not (0 <= goal_x < width and 0 <= goal_z < height):
         return np.empty((0, 2), dtype=np.int32)
-    if grid[start_z, start_x] != 0 or grid[goal_z, goal_x] != 0:
+    if grid[start_z, start_x] or grid[goal_z, goal_x]:
         return np.empty((0, 2), dtype=np.int32)
 
-    # Initialize data structures
-    open_set = np.zeros((width * height, 3), dtype=np.float32)  # (x, z, f_score)
-    open_set_size = 1
-    open_set[0, 0] = start_x
-    open_set[0, 1] = start_z
-    open_set[0, 2] = heuristic(start_x, start_z, goal_x, goal_z)
+    # Per-cell state is stored flat in the grid's own row-major order,
+    # indexed by z * width + x
+    cell_count = width * height
+    start_index = start_z * width + start_x
+    goal_index = goal_z * width + goal_x
 
-    came_from = np.full((width, height, 2), -1, dtype=np.int32)  # Parent positions
+    # Open set is a binary min-heap on f_score. Improved nodes are pushed
+    # again rather than updated in place; stale entries are skipped on pop.
+    # Each cell is expanded once with at most 8 pushes, which bounds the size.
+    heap_capacity = cell_count * 8 + 1
+    heap_f = np.empty(heap_capacity, dtype=np.float32)
+    heap_node = np.empty(heap_capacity, dtype=np.int32)
+    heap_size = _heap_push(heap_f, heap_node, 0,
+                           heuristic(start_x, start_z, goal_x, goal_z), start_index)
 
-    g_score = np.full((width, height), np.inf, dtype=np.float32)
-    g_score[start_x, start_z] = 0.0
-
-    closed_set = np.zeros((width, height), dtype=np.bool_)
-
-    # A* main loop
-    iterations = 0
-    max_iterations = width * height
+    came_from = np.full(cell_count, -1, dtype=np.int32)  # Parent cell index
 
-    while open_set_size > 0 and iterations < max_iterations:
-        iterations += 1
+    g_score = np.full(cell_count, np.inf, dtype=np.float32)
+    g_score[start_index] = 0.0
 
-        # Find node with lowest f_score in open set
-        min_idx = 0
-        min_f = open_set[0, 2]
-        for i in range(1, open_set_size):
-            if open_set[i, 2] < min_f:
-                min_f = open_set[i, 2]
-                min_idx = i
+    closed_set = np.zeros(cell_count, dtype=np.bool_)
 
-        # Get current node
-        current_x = int(open_set[min_idx, 0])
-        current_z = int(open_set[min_idx, 1])
+    # A* main loop
+    while heap_size > 0:
+        # Get node with lowest f_score
+        current, heap_size = _heap_pop(heap_f, heap_node, heap_size)
 
-        # Remove from open set (swap with last and decrease size)
-        open_set[min_idx] = open_set[open_set_size - 1]
-        open_set_size -= 1
+        # Stale duplicate of an already expanded node
+        if closed_set[current]:
+            continue
 
         # Goal reached
-        if current_x == goal_x and current_z == goal_z:
-            return reconstruct_path(came_from, goal_x, goal_z)
+        if current == goal_index:
+            return reconstruct_path(came_from, goal_index, width)
 
         # Mark as closed
-        closed_set[current_x, current_z] = True
+        closed_set[current] = True
+        current_x = current % width
+        current_z = current // width
+        current_g = g_score[current]
 
         # Check neighbors
-        for dx in range(-1, 2):
-            for dz in range(-1, 2):
-                if dx == 0 and dz == 0:
-                    continue
+        for k in range(8):
+            nx = current_x + _NEIGHBOR_DX[k]
+            nz = current_z + _NEIGHBOR_DZ[k]
+
+            # Check bounds
+            if not (0 <= nx < width and 0 <= nz < height):
+                continue
 
-                nx = current_x + dx
-                nz = current_z + dz
+            # Skip if blocked or already closed
+            neighbor = nz * width + nx
+            if grid[nz, nx] or closed_set[neighbor]:
+                continue
 
-                # Check bounds
-                if not (0 <= nx < width and 0 <= nz < height):
+            # Don't cut diagonally between two blocked cells
+            if nx != current_x and nz != current_z:
+                if grid[current_z, nx] and grid[nz, current_x]:
                     continue
 
-                # Skip if blocked or already closed
-                if grid[nz, nx] != 0 or closed_set[nx, nz]:
-                    continue
+            move_cost = _NEIGHBOR_COST[k]
+            tentative_g = current_g + move_cost
 
-                # Calculate movement cost (diagonal = 1.4, straight = 1.0)
-                if dx != 0 and dz != 0:
-                    move_cost = 1.414  # sqrt(2)
-                else:
-                    move_cost = 1.0
-
-                tentative_g = g_score[current_x, current_z] + move_cost
-
-                # Better path found
-                if tentative_g < g_score[nx, nz]:
-                    came_from[nx, nz, 0] = current_x
-                    came_from[nx, nz, 1] = current_z
-                    g_score[nx, nz] = tentative_g
-                    f_score = tentative_g + heuristic(nx, nz, goal_x, goal_z)
-
-                    # Add to open set if not already there
-                    in_open_set = False
-                    for i in range(open_set_size):
-                        if int(open_set[i, 0]) == nx and int(open_set[i, 1]) == nz:
-                            open_set[i, 2] = f_score
-                            in_open_set = True
-                            break
-
-                    if not in_open_set and open_set_size < len(open_set):
-                        open_set[open_set_size, 0] = nx
-                        open_set[open_set_size, 1] = nz
-                        open_set[open_set_size, 2] = f_score
-                        open_set_size += 1
+            # Better path found
+            if tentative_g < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                f_score = tentative_g + heuristic(nx, nz, goal_x, goal_z)
+                heap_size = _heap_push(heap_f, heap_node, heap_size, f_score, neighbor)
 
     # No path found
     return np.empty((0, 2), dtype=np.int32)
@@ -234,8 +261,8 @@ class NavigationGrid:
         self.height = height
         self.cell_size = cell_size
 
-        # Grid (0 = walkable, 1 = blocked)
-        self.grid = np.zeros((height, width), dtype=np.int32)
+        # Grid (0 = walkable, 1 = blocked), indexed [gz, gx]
+        self.grid = np.zeros((height, width), dtype=np.uint8)
 
         # World bounds
         self.min_x = 0.0
@@ -243,6 +270,9 @@ class NavigationGrid:
         self.max_x = width * cell_size
         self.max_z = height * cell_size
 
+        # Grid paths by (start_x, start_z, goal_x, goal_z), cleared when cells change
+        self._path_cache: Dict[Tuple[int, int, int, int], np.ndarray] = {}
+
     def world_to_grid(self, x, z):
         """
         Convert world position to grid coordinates.
@@ -281,6 +311,7 @@ class NavigationGrid:
         """
         if 0 <= gx < self.width and 0 <= gz < self.height:
             self.grid[gz, gx] = 1 if blocked else 0
+            self._path_cache.clear()
 
     def is_walkable(self, gx, gz):
         """
@@ -318,24 +349,27 @@ class NavigationGrid:
         else:
             goal_x, goal_z = self.world_to_grid(goal_pos[0], goal_pos[2] if len(goal_pos) > 2 else goal_pos[1])
 
-        # Run A*
-        path_grid = astar_search(self.grid, start_x, start_z, goal_x, goal_z)
-
-        # Convert to world coordinates
-        path_world = []
-        for i in range(len(path_grid)):
-            gx, gz = path_grid[i]
-            wx, wz = self.grid_to_world(gx, gz)
-
-            # Use Y from start position (assume flat navigation for now)
-            if isinstance(start_pos, glm.vec3):
-                y = start_pos.y
-            else:
-                y = start_pos[1] if len(start_pos) > 1 else 0.0
+        # Run A* (or reuse the path from an identical earlier query)
+        cache_key = (start_x, start_z, goal_x, goal_z)
+        path_grid = self._path_cache.get(cache_key)
+        if path_grid is None:
+            path_grid = astar_search(self.grid, start_x, start_z, goal_x, goal_z)
+            if len(self._path_cache) >= PATH_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._path_cache[next(iter(self._path_cache))]
+            self._path_cache[cache_key] = path_grid
+
+        # Use Y from start position (assume flat navigation for now)
+        if isinstance(start_pos, glm.vec3):
+            y = start_pos.y
+        else:
+            y = start_pos[1] if len(start_pos) > 1 else 0.0
 
-            path_world.append(glm.vec3(wx, y, wz))
+        # Convert all cells to world coordinates at once
+        world_x = self.min_x + (path_grid[:, 0] + 0.5) * self.cell_size
+        world_z = self.min_z + (path_grid[:, 1] + 0.5) * self.cell_size
 
-        return path_world
+        return [glm.vec3(wx, y, wz) for wx, wz in zip(world_x.tolist(), world_z.tolist())]
 
     def block_circle(self, center_x, center_z, radius):
         """
@@ -348,10 +382,15 @@ class NavigationGrid:
         gx, gz = self.world_to_grid(center_x, center_z)
         grid_radius = int(radius / self.cell_size) + 1
 
-        for dx in range(-grid_radius, grid_radius + 1):
-            for dz in range(-grid_radius, grid_radius + 1):
-                if dx*dx + dz*dz <= grid_radius*grid_radius:
-                    self.set_blocked(gx + dx, gz + dz, True)
+        # Bounding box of the circle, clipped to the grid
+        x0, x1 = max(gx - grid_radius, 0), min(gx + grid_radius + 1, self.width)
+        z0, z1 = max(gz - grid_radius, 0), min(gz + grid_radius + 1, self.height)
+        if x0 >= x1 or z0 >= z1:
+            return
+
+        dz, dx = np.ogrid[z0 - gz:z1 - gz, x0 - gx:x1 - gx]
+        self.grid[z0:z1, x0:x1][dx * dx + dz * dz <= grid_radius * grid_radius] = 1
+        self._path_cache.clear()
 
     def block_rect(self, min_x, min_z, max_x, max_z):
         """
@@ -364,9 +403,12 @@ class NavigationGrid:
         gx1, gz1 = self.world_to_grid(min_x, min_z)
         gx2, gz2 = self.world_to_grid(max_x, max_z)
 
-        for gx in range(min(gx1, gx2), max(gx1, gx2) + 1):
-            for gz in range(min(gz1, gz2), max(gz1, gz2) + 1):
-                self.set_blocked(gx, gz, True)
+        # Inclusive cell range, clipped to the grid
+        x0, x1 = max(min(gx1, gx2), 0), min(max(gx1, gx2) + 1, self.width)
+        z0, z1 = max(min(gz1, gz2), 0), min(max(gz1, gz2) + 1, self.height)
+        if x0 < x1 and z0 < z1:
+            self.grid[z0:z1, x0:x1] = 1
+            self._path_cache.clear()
 
 
 class PathFollower:
@@ -401,10 +443,9 @@ class PathFollower:
         # Get current target
         target = self.path[self.current_waypoint]
         direction = target - current_position
-        distance = glm.length(glm.vec2(direction.x, direction.z))
 
-        # Reached waypoint
-        if distance < 0.5:
+        # Reached waypoint (within 0.5 units on the XZ plane)
+        if direction.x * direction.x + direction.z * direction.z < 0.25:
             self.current_waypoint += 1
             if self.current_waypoint >= len(self.path):
                 self.completed = True
@@ -415,7 +456,7 @@ class PathFollower:
             direction = target - current_position
 
         # Move towards target
-        if glm.length(direction) > 0.01:
+        if glm.length2(direction) > 0.0001:  # Longer than 0.01
             direction = glm.normalize(direction)
             return direction * speed
         else:
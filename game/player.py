@@ -1,4 +1,6 @@
 """Player controller with physics."""
+import logging
+import math
 from typing import Optional, Tuple
 import glm
 from engine.camera import Camera
@@ -38,6 +40,11 @@ class Player:
         self.height = 1.8  # meters
         self.radius = 0.4  # meters (capsule radius)
 
+        # Fixed offsets derived from the player dimensions
+        self._half_extents = glm.vec3(self.radius, self.height * 0.5, self.radius)
+        self._center_offset = glm.vec3(0.0, self.height * 0.5, 0.0)
+        self._eye_offset = glm.vec3(0.0, self.height * 0.9, 0.0)  # 90% of player height
+
         # Slope limits
         self.max_slope_angle = 50.0  # degrees - steeper slopes can't be walked up
         self.slide_threshold = 55.0  # degrees - steeper slopes cause sliding
@@ -100,7 +107,7 @@ class Player:
         self._update_stats_with_bonuses()
 
         # Camera
-        self.camera = Camera(position=self.position + glm.vec3(0.0, self.height * 0.9, 0.0))
+        self.camera = Camera(position=self.position + self._eye_offset)
 
         # Cached movement vectors for performance
         self._forward = glm.vec3(0.0, 0.0, -1.0)
@@ -109,17 +116,28 @@ class Player:
 
     def get_collision_box(self) -> AABB:
         """Get the player's collision AABB."""
-        size = glm.vec3(self.radius * 2, self.height, self.radius * 2)
-        return AABB.from_center_size(self.position + glm.vec3(0.0, self.height * 0.5, 0.0), size)
+        center = self.position + self._center_offset
+        return AABB(center - self._half_extents, center + self._half_extents)
 
     def update(self, delta_time: float, terrain: Optional[any] = None) -> None:
         """
-        Update player physics and combat.
+        Update player combat, physics and camera for one frame.
 
         Args:
             delta_time: Time since last frame
             terrain: Terrain object for height queries (optional)
         """
+        self.update_actions(delta_time)
+        self.fixed_update(delta_time, terrain)
+        self.late_update()
+
+    def update_actions(self, delta_time: float) -> None:
+        """
+        Update per-frame combat, dodge movement and spell casting.
+
+        Args:
+            delta_time: Time since last frame
+        """
         # Update combat state (cooldowns, stamina regen, etc.)
         self.combat.update(delta_time)
 
@@ -143,69 +161,82 @@ class Player:
         if was_casting and not self.spell_caster.is_casting and casting_spell:
             self._execute_spell(casting_spell, self._spell_manager)
 
+    def fixed_update(self, delta_time: float, terrain: Optional[any] = None) -> None:
+        """
+        Advance gravity and ground collision by one physics step.
+
+        Args:
+            delta_time: Physics step length
+            terrain: Terrain object for height queries (optional)
+        """
+        # Hot path: bind attributes to locals (the vectors are mutated in place)
+        pos = self.position
+        vel = self.velocity
+
         # Apply gravity
         if not self.is_grounded:
-            self.velocity.y += self.gravity * delta_time
+            vel.y += self.gravity * delta_time
         else:
             # On ground, reset vertical velocity
-            if self.velocity.y < 0:
-                self.velocity.y = 0
+            if vel.y < 0:
+                vel.y = 0
 
         # Store old position for slope checking
-        old_position = glm.vec3(self.position)
+        old_x, old_y, old_z = pos.x, pos.y, pos.z
 
         # Apply velocity to position
-        self.position += self.velocity * delta_time
+        pos += vel * delta_time
 
         # Get terrain height if available
+        ground_height = self.ground_height
         if terrain is not None:
-            self.ground_height = terrain.get_height_at(self.position.x, self.position.z)
+            ground_height = terrain.get_height_at(pos.x, pos.z)
 
         # Ground collision with slope checking
-        if self.position.y <= self.ground_height:
+        if pos.y <= ground_height:
             # Check if slope is too steep to walk up
-            if terrain is not None and old_position.y > 0.1:  # Only check if we have a valid old position
-                # Calculate slope by checking height change
-                old_ground_height = terrain.get_height_at(old_position.x, old_position.z)
-                height_change = self.ground_height - old_ground_height
-                horizontal_distance = glm.length(glm.vec2(
-                    self.position.x - old_position.x,
-                    self.position.z - old_position.z
-                ))
+            if terrain is not None and old_y > 0.1:  # Only check if we have a valid old position
+                step_x = pos.x - old_x
+                step_z = pos.z - old_z
+                horizontal_distance = math.hypot(step_x, step_z)
 
                 if horizontal_distance > 0.001:  # Avoid division by zero
-                    slope_angle = glm.degrees(glm.atan(height_change / horizontal_distance))
+                    # Calculate slope by checking height change
+                    old_ground_height = terrain.get_height_at(old_x, old_z)
+                    height_change = ground_height - old_ground_height
+                    slope_angle = math.degrees(math.atan2(height_change, horizontal_distance))
                 else:
-                    slope_angle = 0.0  # Flat ground or no movement
+                    # No horizontal movement: same ground sample, nothing to climb
+                    height_change = 0.0
+                    slope_angle = 0.0
 
                 # If slope is too steep and we're trying to go up, prevent movement
                 if slope_angle > self.max_slope_angle and height_change > 0:
                     # Restore old horizontal position (can't walk up)
-                    self.position.x = old_position.x
-                    self.position.z = old_position.z
+                    pos.x = old_x
+                    pos.z = old_z
                     # Recalculate ground height at old position
-                    self.ground_height = old_ground_height
+                    ground_height = old_ground_height
 
                 # If slope is extremely steep, slide down
                 elif slope_angle > self.slide_threshold:
-                    # Calculate slide direction (down the slope)
-                    slide_direction = glm.normalize(glm.vec2(
-                        old_position.x - self.position.x,
-                        old_position.z - self.position.z
-                    ))
-                    slide_speed = 2.0 * delta_time
-                    self.position.x += slide_direction.x * slide_speed
-                    self.position.z += slide_direction.y * slide_speed
-
-            self.position.y = self.ground_height
+                    # Slide back the way we came (down the slope)
+                    slide_scale = 2.0 * delta_time / horizontal_distance
+                    pos.x -= step_x * slide_scale
+                    pos.z -= step_z * slide_scale
+
+            pos.y = ground_height
             self.is_grounded = True
-            self.velocity.y = 0
+            vel.y = 0
         else:
             self.is_grounded = False
 
+        self.ground_height = ground_height
+
+    def late_update(self) -> None:
+        """Sync the camera to the player after all movement for the frame."""
         # Update camera position to follow player (eye level)
-        eye_height = self.height * 0.9  # 90% of player height
-        self.camera.position = self.position + glm.vec3(0.0, eye_height, 0.0)
+        self.camera.position = self.position + self._eye_offset
 
     def move(self, direction: str, delta_time: float, sprinting: bool = False) -> None:
         """
@@ -220,15 +251,17 @@ class Player:
         if sprinting:
             speed *= self.sprint_multiplier
 
-        # Use cached movement vectors (updated when camera rotates)
+        # Use cached movement vectors (updated when camera rotates); fold the
+        # scalars first so each move builds a single temporary vector
+        step = speed * delta_time
         if direction == "forward":
-            self.position += self._forward * speed * delta_time
+            self.position += self._forward * step
         elif direction == "backward":
-            self.position -= self._forward * speed * delta_time
+            self.position -= self._forward * step
         elif direction == "left":
-            self.position -= self._right * speed * delta_time
+            self.position -= self._right * step
         elif direction == "right":
-            self.position += self._right * speed * delta_time
+            self.position += self._right * step
 
     def jump(self) -> None:
         """Make the player jump."""
@@ -239,8 +272,10 @@ class Player:
     def _update_movement_vectors(self) -> None:
         """Update cached movement vectors based on camera direction."""
         # Ignore vertical component for movement
-        self._forward = glm.normalize(glm.vec3(self.camera.front.x, 0.0, self.camera.front.z))
-        self._right = glm.normalize(glm.cross(self._forward, glm.vec3(0.0, 1.0, 0.0)))
+        front = self.camera.front
+        self._forward = glm.normalize(glm.vec3(front.x, 0.0, front.z))
+        # forward x up for a horizontal unit forward is already unit length
+        self._right = glm.vec3(-self._forward.z, 0.0, self._forward.x)
 
     def process_mouse_movement(self, xoffset: float, yoffset: float) -> None:
         """Pass mouse movement to camera and update movement vectors."""
@@ -290,7 +325,9 @@ class Player:
             return False
 
         # Store dodge direction (will be applied gradually in update())
-        self.dodge_direction = glm.normalize(glm.vec3(self.camera.front.x, 0.0, self.camera.front.z))
+        front = self.camera.front
+        length = math.hypot(front.x, front.z)  # Pitch is clamped, so never 0
+        self.dodge_direction = glm.vec3(front.x / length, 0.0, front.z / length)
 
         return True
 
@@ -386,7 +423,7 @@ class Player:
                 direction = glm.normalize(glm.vec3(self.camera.front.x, 0.0, self.camera.front.z))
                 teleport_distance = spell.stats.range
                 self.position += direction * teleport_distance
-                self.camera.position = self.position + glm.vec3(0.0, self.height * 0.9, 0.0)
+                self.camera.position = self.position + self._eye_offset
                 logger.info("Teleported!")
 
             return True
@@ -434,10 +471,7 @@ class Player:
     def _update_stats_with_bonuses(self) -> None:
         """Update stats with bonuses from equipment and levels."""
         # Get bonuses
-        equip_damage = self.equipment.get_total_damage_bonus()
-        equip_defense = self.equipment.get_total_defense_bonus()
-        equip_health = self.equipment.get_total_health_bonus()
-        equip_stamina = self.equipment.get_total_stamina_bonus()
+        equip_damage, equip_defense, equip_health, equip_stamina = self.equipment.get_all_bonuses()
 
         level_bonuses = self.progression.get_all_stat_bonuses()
 
@@ -535,7 +569,8 @@ class Player:
             xp_gained: Amount of XP gained
             new_total: New total XP
         """
-        logger.debug(f"+{xp_gained} XP ({new_total}/{self.progression.xp_to_next_level + new_total} to next level)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"+{xp_gained} XP ({new_total}/{self.progression.xp_to_next_level + new_total} to next level)")
 
     def get_power_level(self) -> int:
         """Get player's overall power level."""
@@ -555,7 +590,8 @@ class Player:
             raise ValueError(f"Cannot add negative gold: {amount}")
 
         self.gold += amount
-        logger.info(f"+{amount} gold ({self.gold} total)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"+{amount} gold ({self.gold} total)")
 
     def remove_gold(self, amount: int) -> bool:
         """
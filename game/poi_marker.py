@@ -1,8 +1,37 @@
 """POI visual markers in the game world."""
+import math
+from typing import List
 import glm
+import numpy as np
 from game.entities import Entity
 from world_gen.poi_generator import POI, POIType
 
+# Per-type marker visuals, shared by every marker
+_POI_SCALES = {
+    POIType.VILLAGE: glm.vec3(4.0, 8.0, 4.0),    # Large tower
+    POIType.SHRINE: glm.vec3(2.0, 6.0, 2.0),     # Tall pillar
+    POIType.RUIN: glm.vec3(3.0, 4.0, 3.0),       # Medium cube
+    POIType.DUNGEON: glm.vec3(3.5, 3.0, 3.5),    # Wide entrance
+}
+_DEFAULT_SCALE = glm.vec3(2.0, 2.0, 2.0)
+
+_POI_COLORS = {
+    POIType.VILLAGE: (0.2, 0.8, 0.2),   # Green
+    POIType.SHRINE: (0.3, 0.7, 1.0),    # Light blue
+    POIType.RUIN: (0.9, 0.7, 0.3),      # Gold/amber
+    POIType.DUNGEON: (0.9, 0.2, 0.2),   # Red
+}
+_UNDISCOVERED_COLOR = (0.5, 0.5, 0.5)
+_DEFAULT_COLOR = (1.0, 1.0, 1.0)
+
+_POI_DESCRIPTION_FORMATS = {
+    POIType.VILLAGE: "{name} - Village with NPCs and merchants",
+    POIType.SHRINE: "{name} - Rest and fast travel point",
+    POIType.RUIN: "{name} - Ancient ruins with loot",
+    POIType.DUNGEON: "{name} - Dangerous dungeon (Level {difficulty})",
+}
+_UNDISCOVERED_DESCRIPTION = "??? (Press E to discover)"
+
 
 class POIMarker(Entity):
     """Visual marker for a Point of Interest."""
@@ -20,6 +49,7 @@ class POIMarker(Entity):
         self.poi = poi
         self.interactable = True
         self.description = self._get_description()
+        self._last_discovered = poi.discovered
 
         # Store base position for bobbing animation
         self.base_position = glm.vec3(marker_pos)
@@ -34,41 +64,26 @@ class POIMarker(Entity):
     def _get_description(self) -> str:
         """Get description based on POI type and discovery status."""
         if not self.poi.discovered:
-            return f"??? (Press E to discover)"
-
-        poi_descriptions = {
-            POIType.VILLAGE: f"{self.poi.name} - Village with NPCs and merchants",
-            POIType.SHRINE: f"{self.poi.name} - Rest and fast travel point",
-            POIType.RUIN: f"{self.poi.name} - Ancient ruins with loot",
-            POIType.DUNGEON: f"{self.poi.name} - Dangerous dungeon (Level {self.poi.data.get('difficulty', 1)})",
-        }
+            return _UNDISCOVERED_DESCRIPTION
 
-        return poi_descriptions.get(self.poi.poi_type, self.poi.name)
+        fmt = _POI_DESCRIPTION_FORMATS.get(self.poi.poi_type)
+        if fmt is None:
+            return self.poi.name
+        return fmt.format(name=self.poi.name, difficulty=self.poi.data.get('difficulty', 1))
 
     def _get_scale(self) -> glm.vec3:
         """Get scale based on POI type."""
-        scales = {
-            POIType.VILLAGE: glm.vec3(4.0, 8.0, 4.0),    # Large tower
-            POIType.SHRINE: glm.vec3(2.0, 6.0, 2.0),     # Tall pillar
-            POIType.RUIN: glm.vec3(3.0, 4.0, 3.0),       # Medium cube
-            POIType.DUNGEON: glm.vec3(3.5, 3.0, 3.5),    # Wide entrance
-        }
-        return scales.get(self.poi.poi_type, glm.vec3(2.0, 2.0, 2.0))
+        # Copy so a marker can't modify the shared constant through its scale
+        return glm.vec3(_POI_SCALES.get(self.poi.poi_type, _DEFAULT_SCALE))
 
     def get_color(self) -> tuple:
         """Get marker color based on type and discovery status."""
         if not self.poi.discovered:
             # Undiscovered - gray/subtle
-            return (0.5, 0.5, 0.5)
+            return _UNDISCOVERED_COLOR
 
         # Discovered - bright and type-specific
-        colors = {
-            POIType.VILLAGE: (0.2, 0.8, 0.2),   # Green
-            POIType.SHRINE: (0.3, 0.7, 1.0),    # Light blue
-            POIType.RUIN: (0.9, 0.7, 0.3),      # Gold/amber
-            POIType.DUNGEON: (0.9, 0.2, 0.2),   # Red
-        }
-        return colors.get(self.poi.poi_type, (1.0, 1.0, 1.0))
+        return _POI_COLORS.get(self.poi.poi_type, _DEFAULT_COLOR)
 
     def update(self, delta_time: float):
         """Update marker animation."""
@@ -78,17 +93,84 @@ class POIMarker(Entity):
         self.rotation.y += self.rotation_speed * delta_time
 
         # Bobbing animation - bob upward from base position
-        bob_offset = abs(glm.sin(self.time * self.bob_speed)) * self.bob_height
+        bob_offset = abs(math.sin(self.time * self.bob_speed)) * self.bob_height
         self.position.y = self.base_position.y + bob_offset
 
-        # Update description if discovery status changed
-        if self.description != self._get_description():
+        self._refresh_description()
+
+    def _refresh_description(self):
+        """Update description if discovery status changed."""
+        if self.poi.discovered != self._last_discovered:
             self.description = self._get_description()
+            self._last_discovered = self.poi.discovered
 
     def discover(self):
         """Mark this POI as discovered."""
         if not self.poi.discovered:
             self.poi.discovered = True
             self.description = self._get_description()
+            self._last_discovered = True
             return True
         return False
+
+
+class POIMarkerManager:
+    """Animates all POI markers together."""
+
+    def __init__(self):
+        """Initialize marker manager."""
+        self.markers: List[POIMarker] = []
+
+        # Structure-of-arrays mirror of the animation state, one row per
+        # marker in markers order. Bob and rotation parameters are read when
+        # a marker is added.
+        self._times = np.empty(0)
+        self._base_ys = np.empty(0)
+        self._bob_speeds = np.empty(0)
+        self._bob_heights = np.empty(0)
+        self._rotation_ys = np.empty(0)
+        self._rotation_speeds = np.empty(0)
+
+    def add_marker(self, marker: POIMarker):
+        """
+        Add a marker to the manager.
+
+        Args:
+            marker: POIMarker instance
+        """
+        self.markers.append(marker)
+
+        # Markers are only added at world setup, so growing by one is fine
+        self._times = np.append(self._times, marker.time)
+        self._base_ys = np.append(self._base_ys, marker.base_position.y)
+        self._bob_speeds = np.append(self._bob_speeds, marker.bob_speed)
+        self._bob_heights = np.append(self._bob_heights, marker.bob_height)
+        self._rotation_ys = np.append(self._rotation_ys, marker.rotation.y)
+        self._rotation_speeds = np.append(self._rotation_speeds, marker.rotation_speed)
+
+    def update_all(self, delta_time: float):
+        """
+        Advance rotation and bobbing for every marker in one vectorized pass.
+
+        Args:
+            delta_time: Time since last frame
+        """
+        if not self.markers:
+            return
+
+        self._times += delta_time
+        self._rotation_ys += self._rotation_speeds * delta_time
+        ys = self._base_ys + np.abs(np.sin(self._times * self._bob_speeds)) * self._bob_heights
+
+        # Write results back to the markers that renderers and picking read
+        for marker, time, y, rotation_y in zip(
+            self.markers, self._times.tolist(), ys.tolist(), self._rotation_ys.tolist()
+        ):
+            marker.time = time
+            marker.position.y = y
+            marker.rotation.y = rotation_y
+            marker._refresh_description()
+
+    def __len__(self):
+        """Return number of markers."""
+        return len(self.markers)
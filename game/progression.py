@@ -1,9 +1,11 @@
 """Character progression and leveling system."""
-from typing import Callable, Optional
+import bisect
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 
 
 # XP thresholds for each level (cumulative)
-LEVEL_XP_THRESHOLDS = [
+LEVEL_XP_THRESHOLDS = (
     0,      # Level 1
     100,    # Level 2
     250,    # Level 3
@@ -34,7 +36,7 @@ LEVEL_XP_THRESHOLDS = [
     20250,  # Level 28
     21700,  # Level 29
     23200,  # Level 30 (max)
-]
+)
 
 MAX_LEVEL = len(LEVEL_XP_THRESHOLDS)
 
@@ -46,6 +48,21 @@ STATS_PER_LEVEL = {
     "defense": 1,
 }
 
+# Read-only stat bonuses for each level, indexed by level (index 0 unused).
+# Bonus is per_level * (level - 1) since level 1 is base.
+_LEVEL_STAT_BONUSES = [
+    MappingProxyType({stat: per_level * (level - 1) for stat, per_level in STATS_PER_LEVEL.items()})
+    for level in range(MAX_LEVEL + 1)
+]
+
+# (level start XP, next level XP, XP span) for each level below MAX_LEVEL,
+# indexed by level (index 0 unused)
+_LEVEL_XP_BOUNDS = [None] + [
+    (LEVEL_XP_THRESHOLDS[level - 1], LEVEL_XP_THRESHOLDS[level],
+     LEVEL_XP_THRESHOLDS[level] - LEVEL_XP_THRESHOLDS[level - 1])
+    for level in range(1, MAX_LEVEL)
+]
+
 
 class CharacterProgression:
     """Manages character level and XP progression."""
@@ -70,7 +87,7 @@ class CharacterProgression:
         """Get XP needed to reach next level."""
         if self.level >= MAX_LEVEL:
             return 0
-        return LEVEL_XP_THRESHOLDS[self.level] - self.xp
+        return _LEVEL_XP_BOUNDS[self.level][1] - self.xp
 
     @property
     def xp_progress(self) -> float:
@@ -78,9 +95,7 @@ class CharacterProgression:
         if self.level >= MAX_LEVEL:
             return 1.0
 
-        current_level_xp = LEVEL_XP_THRESHOLDS[self.level - 1]
-        next_level_xp = LEVEL_XP_THRESHOLDS[self.level]
-        level_range = next_level_xp - current_level_xp
+        current_level_xp, _, level_range = _LEVEL_XP_BOUNDS[self.level]
 
         if level_range <= 0:
             return 1.0
@@ -109,15 +124,16 @@ class CharacterProgression:
         if self.on_xp_gain:
             self.on_xp_gain(amount, self.xp)
 
-        # Check for level ups
-        levels_gained = []
-        while self.level < MAX_LEVEL and self.xp >= LEVEL_XP_THRESHOLDS[self.level]:
-            self.level += 1
-            levels_gained.append(self.level)
+        # Check for level ups (number of thresholds reached is the new level)
+        new_level = min(MAX_LEVEL, bisect.bisect_right(LEVEL_XP_THRESHOLDS, self.xp))
+        levels_gained = list(range(self.level + 1, new_level + 1))
+
+        for level in levels_gained:
+            self.level = level
 
             # Trigger level up callback
             if self.on_level_up:
-                self.on_level_up(self.level)
+                self.on_level_up(level)
 
         return levels_gained
 
@@ -131,18 +147,16 @@ class CharacterProgression:
         Returns:
             Total bonus for that stat
         """
-        if stat_name not in STATS_PER_LEVEL:
-            return 0
+        return _LEVEL_STAT_BONUSES[self.level].get(stat_name, 0)
 
-        # Bonus is per_level * (level - 1) since level 1 is base
-        return STATS_PER_LEVEL[stat_name] * (self.level - 1)
+    def get_all_stat_bonuses(self) -> Mapping[str, int]:
+        """
+        Get all stat bonuses from levels.
 
-    def get_all_stat_bonuses(self) -> dict:
-        """Get all stat bonuses from levels."""
-        return {
-            stat: self.get_stat_bonus(stat)
-            for stat in STATS_PER_LEVEL.keys()
-        }
+        Returns:
+            Read-only mapping of stat name -> bonus
+        """
+        return _LEVEL_STAT_BONUSES[self.level]
 
     def set_level(self, level: int) -> None:
         """
@@ -163,7 +177,7 @@ class CharacterProgression:
             "xp_to_next": self.xp_to_next_level,
             "xp_progress": self.xp_progress,
             "is_max_level": self.level >= MAX_LEVEL,
-            "stat_bonuses": self.get_all_stat_bonuses()
+            "stat_bonuses": dict(self.get_all_stat_bonuses())
         }
 
 
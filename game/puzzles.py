@@ -1,38 +1,59 @@
 """Puzzle mechanics and logic."""
+import weakref
+from enum import Enum
 import glm
 from game.entities import Entity
 from game.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Player must be within this XZ distance of a plate's center to press it
+PRESSURE_PLATE_RADIUS = 0.75
+
+
+class PuzzleState(Enum):
+    """Puzzle element states."""
+    INACTIVE = "inactive"
+    ACTIVE = "active"
+    OPEN = "open"      # Doors only
+    CLOSED = "closed"  # Doors only
+
 
 class PuzzleElement(Entity):
     """Base class for puzzle elements."""
 
     def __init__(self, position, name="Puzzle Element"):
         super().__init__(position, name)
-        self.state = "inactive"
-        self.connected_elements = []
+        self.state = PuzzleState.INACTIVE
+        # Weak, insertion-ordered set (dict keys) so elements trigger in connect
+        # order and unloaded elements drop out without explicit teardown
+        self.connected_elements: "weakref.WeakKeyDictionary[PuzzleElement, None]" = (
+            weakref.WeakKeyDictionary()
+        )
         self.interactable = True
 
     def connect_to(self, element):
-        """Connect this element to another."""
-        if element not in self.connected_elements:
-            self.connected_elements.append(element)
+        """
+        Connect this element to another.
+
+        Connections are weak: the target must be kept alive elsewhere (e.g.
+        in the world's entity list) and is dropped once it is unloaded.
+        """
+        self.connected_elements[element] = None
 
     def activate(self):
         """Activate this element."""
-        if self.state != "active":
-            self.state = "active"
+        if self.state != PuzzleState.ACTIVE:
+            self.state = PuzzleState.ACTIVE
             self.on_activate()
-            # Trigger connected elements
-            for element in self.connected_elements:
+            # Trigger connected elements (snapshot, so handlers may connect more)
+            for element in list(self.connected_elements):
                 element.on_triggered(self)
 
     def deactivate(self):
         """Deactivate this element."""
-        if self.state != "inactive":
-            self.state = "inactive"
+        if self.state != PuzzleState.INACTIVE:
+            self.state = PuzzleState.INACTIVE
             self.on_deactivate()
 
     def on_activate(self):
@@ -58,7 +79,7 @@ class Lever(PuzzleElement):
 
     def interact(self):
         """Toggle the lever."""
-        if self.state == "inactive":
+        if self.state == PuzzleState.INACTIVE:
             self.activate()
             logger.debug(f"{self.name} activated!")
         else:
@@ -88,6 +109,7 @@ class Button(PuzzleElement):
         # Store original position to prevent floating point drift
         self.base_position = glm.vec3(position)
         self.pressed_offset = -0.1
+        self._pressed_position = self.base_position + glm.vec3(0.0, self.pressed_offset, 0.0)
 
     def interact(self):
         """Press the button."""
@@ -96,7 +118,7 @@ class Button(PuzzleElement):
 
     def update(self, delta_time):
         """Handle auto-reset timer."""
-        if self.state == "active" and self.auto_reset:
+        if self.state == PuzzleState.ACTIVE and self.auto_reset:
             self.reset_timer += delta_time
             if self.reset_timer >= self.reset_delay:
                 self.deactivate()
@@ -105,9 +127,7 @@ class Button(PuzzleElement):
 
     def on_activate(self):
         """Visual feedback - button pressed down."""
-        self.position = glm.vec3(self.base_position.x,
-                                 self.base_position.y + self.pressed_offset,
-                                 self.base_position.z)
+        self.position = glm.vec3(self._pressed_position)
 
     def on_deactivate(self):
         """Visual feedback - button pops back up."""
@@ -120,11 +140,12 @@ class Door(PuzzleElement):
     def __init__(self, position, name="Door", locked=True, timed=False, timer_duration=5.0):
         super().__init__(position, name)
         self.locked = locked
-        self.state = "closed"
+        self.state = PuzzleState.CLOSED
         self.description = f"A door. {'Locked.' if locked else 'Press E to open.'}"
         self.scale = glm.vec3(2.0, 3.0, 0.2)
         self.open_offset = glm.vec3(0.0, 2.5, 0.0)  # Move up when open
         self.closed_position = glm.vec3(position)
+        self._open_position = self.closed_position + self.open_offset
         self.interactable = not locked
 
         # Timed door properties
@@ -134,7 +155,7 @@ class Door(PuzzleElement):
 
     def update(self, delta_time):
         """Handle timed door closing."""
-        if self.timed and self.state == "open":
+        if self.timed and self.state == PuzzleState.OPEN:
             self.timer += delta_time
             if self.timer >= self.timer_duration:
                 self.close()
@@ -147,16 +168,16 @@ class Door(PuzzleElement):
             logger.info(f"{self.name} is locked!")
             return
 
-        if self.state == "closed":
+        if self.state == PuzzleState.CLOSED:
             self.open()
         else:
             self.close()
 
     def open(self):
         """Open the door."""
-        if self.state != "open":
-            self.state = "open"
-            self.position = self.closed_position + self.open_offset
+        if self.state != PuzzleState.OPEN:
+            self.state = PuzzleState.OPEN
+            self.position = glm.vec3(self._open_position)
             self.timer = 0.0
             if self.timed:
                 logger.info(f"{self.name} opened! (Closes in {self.timer_duration}s)")
@@ -165,9 +186,9 @@ class Door(PuzzleElement):
 
     def close(self):
         """Close the door."""
-        if self.state != "closed":
-            self.state = "closed"
-            self.position = self.closed_position
+        if self.state != PuzzleState.CLOSED:
+            self.state = PuzzleState.CLOSED
+            self.position = glm.vec3(self.closed_position)
             logger.info(f"{self.name} closed!")
 
     def unlock(self):
@@ -197,28 +218,29 @@ class PressurePlate(PuzzleElement):
 
         # Store original position to prevent floating point drift
         self.base_position = glm.vec3(position)
+        self._pressed_position = self.base_position + glm.vec3(0.0, self.active_height, 0.0)
 
     def check_activation(self, player_position):
         """Check if player is standing on the plate."""
         # Use base_position for consistent distance checking
-        distance_xz = glm.length(glm.vec2(
-            player_position.x - self.base_position.x,
-            player_position.z - self.base_position.z
-        ))
+        base = self.base_position
+        dx = player_position.x - base.x
+        dz = player_position.z - base.z
 
         # Player must be close in XZ and near ground level
-        if distance_xz < 0.75 and abs(player_position.y - self.base_position.y) < 1.0:
-            if self.state != "active":
+        pressed = (dx * dx + dz * dz < PRESSURE_PLATE_RADIUS * PRESSURE_PLATE_RADIUS
+                   and abs(player_position.y - base.y) < 1.0)
+
+        # Only act when the plate's state has to change
+        if pressed != (self.state == PuzzleState.ACTIVE):
+            if pressed:
                 self.activate()
-        else:
-            if self.state != "inactive":
+            else:
                 self.deactivate()
 
     def on_activate(self):
         """Visual feedback - plate pressed down."""
-        self.position = glm.vec3(self.base_position.x,
-                                 self.base_position.y + self.active_height,
-                                 self.base_position.z)
+        self.position = glm.vec3(self._pressed_position)
 
     def on_deactivate(self):
         """Visual feedback - plate rises back."""
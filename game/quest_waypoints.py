@@ -57,10 +57,24 @@ class QuestWaypoint:
         Returns:
             Distance in world units
         """
-        wx, _, wz = self.position
-        dx = player_x - wx
-        dz = player_z - wz
-        return math.sqrt(dx * dx + dz * dz)
+        return math.sqrt(self.distance_sq_to(player_x, player_z))
+
+    def distance_sq_to(self, player_x: float, player_z: float) -> float:
+        """
+        Calculate squared distance from player to waypoint (2D).
+
+        Cheaper than distance_to for comparisons against a radius.
+
+        Args:
+            player_x, player_z: Player world position
+
+        Returns:
+            Squared distance in world units
+        """
+        position = self.position
+        dx = player_x - position[0]
+        dz = player_z - position[2]
+        return dx * dx + dz * dz
 
     def direction_to(self, player_x: float, player_z: float) -> float:
         """
@@ -87,8 +101,8 @@ class QuestWaypoint:
         Returns:
             True if player is in range
         """
-        distance = self.distance_to(player_x, player_z)
-        return distance <= self.radius
+        radius = self.radius
+        return self.distance_sq_to(player_x, player_z) <= radius * radius
 
 
 class WaypointManager:
@@ -151,11 +165,14 @@ class WaypointManager:
         Returns:
             Nearest waypoint, or None if no active waypoints
         """
-        active = self.get_active_waypoints()
-        if not active:
-            return None
-
-        nearest = min(active, key=lambda w: w.distance_to(player_x, player_z))
+        nearest = None
+        nearest_dist_sq = 0.0
+        for waypoint in self.waypoints:
+            if waypoint.active and not waypoint.completed:
+                dist_sq = waypoint.distance_sq_to(player_x, player_z)
+                if nearest is None or dist_sq < nearest_dist_sq:
+                    nearest = waypoint
+                    nearest_dist_sq = dist_sq
         return nearest
 
     def get_waypoints_in_range(
@@ -174,10 +191,11 @@ class WaypointManager:
         Returns:
             List of waypoints within range
         """
-        active = self.get_active_waypoints()
+        max_distance_sq = max_distance * max_distance
         return [
-            w for w in active
-            if w.distance_to(player_x, player_z) <= max_distance
+            w for w in self.waypoints
+            if w.active and not w.completed
+            and w.distance_sq_to(player_x, player_z) <= max_distance_sq
         ]
 
     def update_waypoint_states(
@@ -223,7 +241,7 @@ class WaypointManager:
         Returns:
             Tuple of (active_count, total_count)
         """
-        active = len(self.get_active_waypoints())
+        active = sum(1 for w in self.waypoints if w.active and not w.completed)
         total = len(self.waypoints)
         return (active, total)
 
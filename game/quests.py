@@ -1,4 +1,5 @@
 """Quest system for tracking objectives and progression."""
+import sys
 from enum import Enum
 from typing import Dict, List, Callable, Optional, TYPE_CHECKING
 
@@ -37,7 +38,8 @@ class QuestObjective:
             description: Human-readable description
             objective_type: Type of objective
         """
-        self.objective_id = objective_id
+        # Interned so id lookups and comparisons can match on identity
+        self.objective_id = sys.intern(objective_id)
         self.description = description
         self.objective_type = objective_type
 
@@ -52,8 +54,13 @@ class QuestObjective:
         # Rewards
         self.on_complete = None  # Callback when objective completes
 
+        # Set by the owning Quest; called with +1/-1 when completed flips
+        self._on_completed_change: Optional[Callable[[int], None]] = None
+        self._progress_text: Optional[str] = None  # Cached get_progress_text()
+
         # Waypoint for navigation (Phase 6 enhancement)
-        self.waypoint: Optional['QuestWaypoint'] = None
+        self._waypoint: Optional['QuestWaypoint'] = None
+        self._waypoint_factory: Optional[Callable[[], 'QuestWaypoint']] = None
 
     def set_target(self, target):
         """
@@ -63,6 +70,7 @@ class QuestObjective:
             target: Number of times objective must be completed
         """
         self.target = target
+        self._progress_text = None
 
     def set_completion_func(self, func):
         """
@@ -82,6 +90,32 @@ class QuestObjective:
         """
         self.waypoint = waypoint
 
+    def set_waypoint_factory(self, factory: Callable[[], 'QuestWaypoint']) -> None:
+        """
+        Set a function that creates this objective's waypoint on first use.
+
+        The waypoint is only built when it is first read (e.g. once the quest
+        is active and the HUD asks for waypoints).
+
+        Args:
+            factory: Zero-argument callable returning a QuestWaypoint
+        """
+        self._waypoint = None
+        self._waypoint_factory = factory
+
+    @property
+    def waypoint(self) -> Optional['QuestWaypoint']:
+        """Waypoint for navigation, created on demand if a factory was set."""
+        if self._waypoint is None and self._waypoint_factory is not None:
+            self._waypoint = self._waypoint_factory()
+            self._waypoint_factory = None
+        return self._waypoint
+
+    @waypoint.setter
+    def waypoint(self, waypoint: Optional['QuestWaypoint']) -> None:
+        self._waypoint = waypoint
+        self._waypoint_factory = None
+
     def progress(self, amount=1):
         """
         Progress the objective.
@@ -95,13 +129,11 @@ class QuestObjective:
         if self.completed:
             return False
 
-        old_current = self.current
         self.current = min(self.current + amount, self.target)
+        self._progress_text = None
 
         if self.current >= self.target and not self.completed:
-            self.completed = True
-            if self.on_complete:
-                self.on_complete()
+            self._mark_completed()
             return True
 
         return False
@@ -118,9 +150,7 @@ class QuestObjective:
 
         if self.completion_func:
             if self.completion_func():
-                self.completed = True
-                if self.on_complete:
-                    self.on_complete()
+                self._mark_completed()
                 return True
 
         return False
@@ -132,14 +162,30 @@ class QuestObjective:
         Returns:
             str: Progress string (e.g., "2/5")
         """
-        if self.target > 1:
-            return f"{self.current}/{self.target}"
-        return "Complete" if self.completed else "Incomplete"
+        if self._progress_text is None:
+            if self.target > 1:
+                self._progress_text = f"{self.current}/{self.target}"
+            else:
+                self._progress_text = "Complete" if self.completed else "Incomplete"
+        return self._progress_text
+
+    def _mark_completed(self):
+        """Flag the objective complete, then notify the owning quest."""
+        self.completed = True
+        self._progress_text = None
+        if self.on_complete:
+            self.on_complete()
+        if self._on_completed_change:
+            self._on_completed_change(1)
 
     def reset(self):
         """Reset objective progress."""
+        was_completed = self.completed
         self.current = 0
         self.completed = False
+        self._progress_text = None
+        if was_completed and self._on_completed_change:
+            self._on_completed_change(-1)
 
 
 class Quest:
@@ -154,13 +200,17 @@ class Quest:
             title: Quest title
             description: Quest description
         """
-        self.quest_id = quest_id
+        # Interned so QuestManager dict/set lookups can match on identity
+        self.quest_id = sys.intern(quest_id)
         self.title = title
         self.description = description
         self.status = QuestStatus.NOT_STARTED
 
         # Objectives
         self.objectives = []  # List of QuestObjective
+        self._objectives_by_id = {}  # objective_id -> QuestObjective (first added wins)
+        self._completed_count = 0  # Completed objectives, kept up to date by the objectives
+        self._polled_objectives = []  # Objectives with a completion_func, set on start()
         self.current_objective_index = 0
 
         # NPCs
@@ -178,6 +228,7 @@ class Quest:
         self.on_start = None
         self.on_complete = None
         self.on_fail = None
+        self._on_completed_hook = None  # Set by QuestManager to track completion
 
     def add_objective(self, objective):
         """
@@ -190,13 +241,29 @@ class Quest:
             int: Index of added objective
         """
         self.objectives.append(objective)
+        self._objectives_by_id.setdefault(objective.objective_id, objective)
+        objective._on_completed_change = self._on_objective_completed_change
+        if objective.completed:
+            self._completed_count += 1
         return len(self.objectives) - 1
 
+    def _on_objective_completed_change(self, delta):
+        """Track an objective becoming complete (+1) or being reset (-1)."""
+        self._completed_count += delta
+
+        # Completing the last objective completes an active quest right away
+        if (delta > 0 and self.status == QuestStatus.ACTIVE
+                and self._completed_count == len(self.objectives)):
+            self.complete()
+
     def start(self):
         """Start the quest."""
         if self.status == QuestStatus.NOT_STARTED:
             self.status = QuestStatus.ACTIVE
             self.current_objective_index = 0
+            self._polled_objectives = [
+                objective for objective in self.objectives if objective.completion_func
+            ]
             if self.on_start:
                 self.on_start()
             return True
@@ -229,30 +296,20 @@ class Quest:
 
         # Find objective
         if objective_id:
-            objective = None
-            for obj in self.objectives:
-                if obj.objective_id == objective_id:
-                    objective = obj
-                    break
-            if not objective:
-                return False
+            objective = self._objectives_by_id.get(objective_id)
         else:
             objective = self.get_current_objective()
-            if not objective:
-                return False
+        if not objective:
+            return False
 
-        # Progress it
+        # Progress it (completing the last objective completes the quest)
         just_completed = objective.progress(amount)
 
         # If current objective completed, move to next
         if just_completed and objective == self.get_current_objective():
             self.current_objective_index += 1
 
-            # Check if all objectives complete
-            if self.current_objective_index >= len(self.objectives):
-                return self.complete()
-
-        return False
+        return self.status == QuestStatus.COMPLETED
 
     def check_completion(self):
         """
@@ -264,17 +321,45 @@ class Quest:
         if self.status != QuestStatus.ACTIVE:
             return False
 
-        # Check all objectives
-        all_complete = True
-        for objective in self.objectives:
-            if not objective.check_completion():
-                all_complete = False
-                break
+        # Poll objectives only while some have not reported completion
+        if self._completed_count < len(self.objectives):
+            for objective in self.objectives:
+                if not objective.check_completion():
+                    return False
+
+            # The last objective to complete finished the quest
+            return self.status == QuestStatus.COMPLETED
+
+        return self.complete()
+
+    @property
+    def needs_polling(self):
+        """Whether poll_completion can still complete this quest."""
+        return bool(self._polled_objectives) or self._completed_count == len(self.objectives)
+
+    def poll_completion(self):
+        """
+        Poll the objectives that can only be checked by polling.
+
+        Objectives progressed through progress() complete the quest as soon
+        as the last one finishes. Only objectives with a completion_func need
+        polling each frame.
+
+        Returns:
+            bool: True if quest completed
+        """
+        if self.status != QuestStatus.ACTIVE:
+            return False
 
-        if all_complete:
+        for objective in self._polled_objectives:
+            if not objective.completed:
+                objective.check_completion()
+
+        # Objectives completed before the quest started never fired the event
+        if self.status == QuestStatus.ACTIVE and self._completed_count == len(self.objectives):
             return self.complete()
 
-        return False
+        return self.status == QuestStatus.COMPLETED
 
     def complete(self):
         """
@@ -287,6 +372,8 @@ class Quest:
             return False
 
         self.status = QuestStatus.COMPLETED
+        if self._on_completed_hook:
+            self._on_completed_hook(self)
 
         # Apply rewards
         if self.reward_func:
@@ -334,8 +421,7 @@ class Quest:
         elif self.status == QuestStatus.FAILED:
             return "Failed"
         elif self.status == QuestStatus.ACTIVE:
-            completed = sum(1 for obj in self.objectives if obj.completed)
-            return f"{completed}/{len(self.objectives)} objectives"
+            return f"{self._completed_count}/{len(self.objectives)} objectives"
         else:
             return "Not started"
 
@@ -348,6 +434,7 @@ class QuestManager:
         self.quests = {}  # quest_id -> Quest
         self.active_quests = set()  # Set of active quest IDs (O(1) lookups)
         self.completed_quests = set()  # Set of completed quest IDs (O(1) lookups)
+        self._polled_quests = set()  # Active quest IDs that update() must poll
 
     def register_quest(self, quest):
         """
@@ -360,8 +447,31 @@ class QuestManager:
             str: Quest ID
         """
         self.quests[quest.quest_id] = quest
+        quest._on_completed_hook = self._on_quest_completed
         return quest.quest_id
 
+    def register_quests(self, quests):
+        """
+        Register several quests at once.
+
+        Args:
+            quests: Iterable of Quest instances
+
+        Returns:
+            List[str]: Registered quest IDs, in order
+        """
+        quests = list(quests)
+        self.quests.update((quest.quest_id, quest) for quest in quests)
+        for quest in quests:
+            quest._on_completed_hook = self._on_quest_completed
+        return [quest.quest_id for quest in quests]
+
+    def _on_quest_completed(self, quest):
+        """Move a quest from active to completed as soon as it completes."""
+        self.active_quests.discard(quest.quest_id)
+        self._polled_quests.discard(quest.quest_id)
+        self.completed_quests.add(quest.quest_id)
+
     def start_quest(self, quest_id):
         """
         Start a quest.
@@ -381,11 +491,15 @@ class QuestManager:
         if not self.check_prerequisites(quest_id):
             return False
 
-        if quest.start():
-            self.active_quests.add(quest_id)
-            return True
+        if quest.status != QuestStatus.NOT_STARTED:
+            return False
 
-        return False
+        # Track as active first: on_start may already progress and complete it
+        self.active_quests.add(quest_id)
+        quest.start()
+        if quest.status == QuestStatus.ACTIVE and quest.needs_polling:
+            self._polled_quests.add(quest_id)
+        return True
 
     def complete_quest(self, quest_id):
         """
@@ -400,14 +514,7 @@ class QuestManager:
         if quest_id not in self.quests:
             return False
 
-        quest = self.quests[quest_id]
-        if quest.complete():
-            if quest_id in self.active_quests:
-                self.active_quests.remove(quest_id)
-            self.completed_quests.add(quest_id)
-            return True
-
-        return False
+        return self.quests[quest_id].complete()
 
     def progress_quest(self, quest_id, objective_id=None, amount=1):
         """
@@ -424,16 +531,8 @@ class QuestManager:
         if quest_id not in self.quests:
             return False
 
-        quest = self.quests[quest_id]
-        completed = quest.progress_objective(objective_id, amount)
-
-        # If quest just completed, update tracking
-        if completed:
-            if quest_id in self.active_quests:
-                self.active_quests.remove(quest_id)
-            self.completed_quests.add(quest_id)
-
-        return completed
+        # Completion moves the quest to completed_quests via _on_quest_completed
+        return self.quests[quest_id].progress_objective(objective_id, amount)
 
     def progress_objective(self, quest_id, objective_id, amount=1):
         """
@@ -600,18 +699,26 @@ class QuestManager:
         return quest
 
     def update(self):
-        """Update all active quests (check for completion)."""
-        for quest_id in list(self.active_quests):  # Copy set to allow modification
-            quest = self.quests.get(quest_id)
-            if quest and quest.check_completion():
-                self.active_quests.remove(quest_id)
-                self.completed_quests.add(quest_id)
+        """Poll active quests whose objectives need polling (completion_func)."""
+        polled = self._polled_quests
+        if not polled:
+            return
+
+        quests_get = self.quests.get
+        for quest_id in tuple(polled):  # Completing a quest removes it from the set
+            quest = quests_get(quest_id)
+            if quest is None or quest.status != QuestStatus.ACTIVE:
+                # Failed or reset outside the manager
+                polled.discard(quest_id)
+            else:
+                quest.poll_completion()
 
     def clear_all(self):
         """Clear all quests (for new game sessions)."""
         self.quests.clear()
         self.active_quests.clear()
         self.completed_quests.clear()
+        self._polled_quests.clear()
 
     def get_active_waypoints(self) -> List['QuestWaypoint']:
         """
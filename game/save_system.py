@@ -3,16 +3,86 @@ import json
 import os
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from game.equipment import EquipmentSlot
 from game.logger import get_logger
 from game.input_validation import validate_slot_number, ValidationError
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 logger = get_logger(__name__)
 
 # Current save format version
 CURRENT_SAVE_VERSION = "1.0.0"
 
+# Top-level sections every saved game state must contain
+_GAME_STATE_SECTIONS = ("player", "inventory", "equipment", "progression", "quests", "world", "play_time")
+
+# Required keys of each dict section, mapped to their accepted types
+# (None accepts any value)
+_SECTION_FIELD_TYPES = {
+    "player": {
+        "position": list,
+        "camera_yaw": (int, float),
+        "camera_pitch": (int, float),
+        "health": (int, float),
+        "max_health": (int, float),
+        "stamina": (int, float),
+        "max_stamina": (int, float),
+        "level": int,
+        "gold": int,
+    },
+    "inventory": {
+        "equipment_items": list,
+        "consumables": list,
+        "key_items": list,
+        "materials": dict,
+    },
+    "equipment": {
+        "weapon": None,
+        "armor": None,
+        "accessory": None,
+    },
+    "progression": {
+        "level": int,
+        "xp": int,
+        "skill_points": int,
+    },
+    "quests": {
+        "active": list,
+        "completed": list,
+    },
+}
+
+# Save info by save file path, tagged with the file's (mtime_ns, size) when
+# it was read so list_saves only re-parses files that changed. save_game and
+# delete_save drop entries themselves, since coarse filesystem timestamps can
+# miss a same-size overwrite.
+_save_info_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize save data to indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(payload: bytes) -> Any:
+    """
+    Parse UTF-8 JSON save data.
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON (orjson's
+            decode error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
 
 class SaveDataValidator:
     """Validates save data format and handles version migrations."""
@@ -62,103 +132,25 @@ class SaveDataValidator:
         Returns:
             True if valid, False otherwise
         """
-        required_sections = ["player", "inventory", "equipment", "progression", "quests", "world", "play_time"]
-
-        for section in required_sections:
+        for section in _GAME_STATE_SECTIONS:
             if section not in game_state:
                 logger.error(f"Missing required game state section: {section}")
                 return False
 
-        # Validate player section
-        player = game_state["player"]
-        player_keys = ["position", "camera_yaw", "camera_pitch", "health", "max_health",
-                       "stamina", "max_stamina", "level", "gold"]
-        for key in player_keys:
-            if key not in player:
-                logger.error(f"Missing required player key: {key}")
-                return False
+        for section, field_types in _SECTION_FIELD_TYPES.items():
+            data = game_state[section]
+            for field, expected_types in field_types.items():
+                if field not in data:
+                    logger.error(f"Missing required {section} key: {field}")
+                    return False
+                if expected_types is not None and not isinstance(data[field], expected_types):
+                    logger.error(f"Invalid {section} {field} type: {type(data[field])}")
+                    return False
 
         # Validate position is a list of 3 numbers
-        if not isinstance(player["position"], list) or len(player["position"]) != 3:
-            logger.error(f"Invalid player position format: {player['position']}")
-            return False
-
-        # Validate numeric fields
-        numeric_fields = {
-            "health": (int, float),
-            "max_health": (int, float),
-            "stamina": (int, float),
-            "max_stamina": (int, float),
-            "level": int,
-            "gold": int,
-            "camera_yaw": (int, float),
-            "camera_pitch": (int, float)
-        }
-
-        for field, expected_types in numeric_fields.items():
-            if not isinstance(player[field], expected_types):
-                logger.error(f"Invalid player {field} type: {type(player[field])}")
-                return False
-
-        # Validate inventory section
-        inventory = game_state["inventory"]
-        inventory_keys = ["equipment_items", "consumables", "key_items", "materials"]
-        for key in inventory_keys:
-            if key not in inventory:
-                logger.error(f"Missing required inventory key: {key}")
-                return False
-
-        # Validate inventory lists
-        if not isinstance(inventory["equipment_items"], list):
-            logger.error(f"Invalid equipment_items type: {type(inventory['equipment_items'])}")
-            return False
-        if not isinstance(inventory["consumables"], list):
-            logger.error(f"Invalid consumables type: {type(inventory['consumables'])}")
-            return False
-        if not isinstance(inventory["key_items"], list):
-            logger.error(f"Invalid key_items type: {type(inventory['key_items'])}")
-            return False
-        if not isinstance(inventory["materials"], dict):
-            logger.error(f"Invalid materials type: {type(inventory['materials'])}")
-            return False
-
-        # Validate equipment section
-        equipment = game_state["equipment"]
-        equipment_slots = ["weapon", "armor", "accessory"]
-        for slot in equipment_slots:
-            if slot not in equipment:
-                logger.error(f"Missing required equipment slot: {slot}")
-                return False
-
-        # Validate progression section
-        progression = game_state["progression"]
-        progression_keys = ["level", "xp", "skill_points"]
-        for key in progression_keys:
-            if key not in progression:
-                logger.error(f"Missing required progression key: {key}")
-                return False
-
-        # Validate progression numeric fields
-        if not isinstance(progression["level"], int):
-            logger.error(f"Invalid progression level type: {type(progression['level'])}")
-            return False
-        if not isinstance(progression["xp"], int):
-            logger.error(f"Invalid progression xp type: {type(progression['xp'])}")
-            return False
-        if not isinstance(progression["skill_points"], int):
-            logger.error(f"Invalid progression skill_points type: {type(progression['skill_points'])}")
-            return False
-
-        # Validate quests section
-        quests = game_state["quests"]
-        if "active" not in quests or "completed" not in quests:
-            logger.error("Missing required quests keys: active or completed")
-            return False
-        if not isinstance(quests["active"], list):
-            logger.error(f"Invalid quests active type: {type(quests['active'])}")
-            return False
-        if not isinstance(quests["completed"], list):
-            logger.error(f"Invalid quests completed type: {type(quests['completed'])}")
+        position = game_state["player"]["position"]
+        if len(position) != 3:
+            logger.error(f"Invalid player position format: {position}")
             return False
 
         # Validate play_time
@@ -209,13 +201,17 @@ class SaveSystem:
         self.save_dir.mkdir(exist_ok=True)
         logger.info(f"SaveSystem initialized (save directory: {self.save_dir})")
 
-    def save_game(self, slot: int, game_state: Dict[str, Any]) -> bool:
+    def save_game(self, slot: int, game_state: Dict[str, Any], validate: bool = False) -> bool:
         """
         Save game state to a slot.
 
+        State built by serialize_game_state is trusted and written as-is;
+        load_game always validates what it reads back.
+
         Args:
             slot: Save slot number (1-5)
             game_state: Dictionary containing all game state to save
+            validate: Validate game state and metadata before writing
 
         Returns:
             True if save successful, False otherwise
@@ -229,7 +225,7 @@ class SaveSystem:
 
         try:
             # Validate game state before saving
-            if not SaveDataValidator.validate_game_state(game_state):
+            if validate and not SaveDataValidator.validate_game_state(game_state):
                 logger.error(f"Invalid game state structure, cannot save to slot {slot}")
                 return False
 
@@ -244,14 +240,16 @@ class SaveSystem:
             }
 
             # Validate metadata
-            if not SaveDataValidator.validate_metadata(save_data["metadata"]):
+            if validate and not SaveDataValidator.validate_metadata(save_data["metadata"]):
                 logger.error(f"Invalid metadata structure, cannot save to slot {slot}")
                 return False
 
             # Save to file
             save_file = self.save_dir / f"save_slot_{slot}.json"
-            with open(save_file, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            payload = _dumps(save_data)
+            with open(save_file, 'wb') as f:
+                f.write(payload)
+            _save_info_cache.pop(save_file, None)
 
             logger.info(f"Game saved to slot {slot}: {save_file}")
             return True
@@ -287,8 +285,8 @@ class SaveSystem:
                 logger.warning(f"No save file found in slot {slot}")
                 return None
 
-            with open(save_file, 'r') as f:
-                save_data = json.load(f)
+            with open(save_file, 'rb') as f:
+                save_data = _loads(f.read())
 
             # Validate metadata
             metadata = save_data.get("metadata", {})
@@ -347,6 +345,7 @@ class SaveSystem:
 
             if save_file.exists():
                 save_file.unlink()
+                _save_info_cache.pop(save_file, None)
                 logger.info(f"Deleted save file in slot {slot}")
                 return True
             else:
@@ -361,6 +360,9 @@ class SaveSystem:
         """
         Get metadata about a save file without loading full game state.
 
+        Results are cached until the save file's modification time or size
+        changes.
+
         Args:
             slot: Save slot number (1-5)
 
@@ -377,22 +379,31 @@ class SaveSystem:
             save_file = self.save_dir / f"save_slot_{slot}.json"
 
             if not save_file.exists():
+                _save_info_cache.pop(save_file, None)
                 return None
 
-            with open(save_file, 'r') as f:
-                save_data = json.load(f)
+            stat = save_file.stat()
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            cached = _save_info_cache.get(save_file)
+            if cached is not None and cached[0] == file_key:
+                return dict(cached[1])
+
+            with open(save_file, 'rb') as f:
+                save_data = _loads(f.read())
 
             # Return metadata and basic player info
             metadata = save_data.get("metadata", {})
             game_state = save_data.get("game_state", {})
 
-            return {
+            info = {
                 "timestamp": metadata.get("timestamp"),
                 "version": metadata.get("version"),
                 "player_level": game_state.get("player", {}).get("level", 1),
                 "player_position": game_state.get("player", {}).get("position", [0, 0, 0]),
                 "play_time": game_state.get("play_time", 0),
             }
+            _save_info_cache[save_file] = (file_key, info)
+            return dict(info)
 
         except (IOError, OSError) as e:
             logger.error(f"Failed to read save file for slot {slot}: {e}")
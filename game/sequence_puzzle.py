@@ -97,6 +97,7 @@ class ColoredButton(PuzzleElement):
         # Store original position to prevent floating point drift
         self.base_position = glm.vec3(position)
         self.pressed_offset = -0.15
+        self._pressed_position = self.base_position + glm.vec3(0.0, self.pressed_offset, 0.0)
 
     def interact(self):
         """Press the colored button."""
@@ -105,9 +106,7 @@ class ColoredButton(PuzzleElement):
 
     def on_activate(self):
         """Visual feedback."""
-        self.position = glm.vec3(self.base_position.x,
-                                 self.base_position.y + self.pressed_offset,
-                                 self.base_position.z)
+        self.position = glm.vec3(self._pressed_position)
 
     def on_deactivate(self):
         """Reset visual."""
@@ -387,7 +387,7 @@ class UI:
             if waypoints:
                 # Find nearest waypoint
                 player_x, player_z = player.position.x, player.position.z
-                nearest = min(waypoints, key=lambda w: w.distance_to(player_x, player_z))
+                nearest = min(waypoints, key=lambda w: w.distance_sq_to(player_x, player_z))
 
                 # Draw waypoint info (top right corner)
                 info_x = self.width - 10
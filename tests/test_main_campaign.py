@@ -0,0 +1,58 @@
+"""Unit tests for the main quest campaign."""
+import unittest
+from unittest.mock import Mock, patch
+from game.quests import QuestManager
+from game.main_campaign import MainCampaign
+
+
+class TestMainCampaign(unittest.TestCase):
+    """Test MainCampaign quest flow."""
+
+    def setUp(self):
+        """Create a campaign with a mocked player."""
+        self.quest_manager = QuestManager()
+        self.player = Mock()
+        self.player.stats.max_health = 100
+        self.campaign = MainCampaign(self.quest_manager, self.player)
+
+    def _finish_quest(self, quest_id):
+        """Start a quest and complete every objective."""
+        quest = self.quest_manager.get_quest(quest_id)
+        if not self.quest_manager.is_quest_active(quest_id):
+            self.quest_manager.start_quest(quest_id)
+        with patch("game.crafting.get_crafting_manager"):
+            for objective in quest.objectives:
+                self.quest_manager.progress_quest(
+                    quest_id, objective.objective_id, objective.target
+                )
+
+    def test_registers_all_quests(self):
+        """Test all campaign quests are registered."""
+        self.assertEqual(len(self.campaign.campaign_quests), 8)
+        for quest_id in self.campaign.campaign_quests:
+            self.assertIsNotNone(self.quest_manager.get_quest(quest_id))
+
+    def test_final_quest_waits_for_both_prerequisites(self):
+        """Test final quest unlocks only after caves and shrine complete."""
+        self._finish_quest("main_6_crystal_caves")
+        self.assertFalse(self.quest_manager.is_quest_active("main_8_final_boss"))
+
+        self._finish_quest("main_7_ancient_shrine")
+        self.assertTrue(self.quest_manager.is_quest_active("main_8_final_boss"))
+
+    def test_campaign_progress(self):
+        """Test campaign progress counts completed and active quests."""
+        self.campaign.start_campaign()
+        self._finish_quest("main_1_awakening")
+
+        progress = self.campaign.get_campaign_progress()
+        self.assertEqual(progress["total_quests"], 8)
+        self.assertEqual(progress["completed"], 1)
+        self.assertEqual(progress["active"], 1)
+        self.assertAlmostEqual(progress["progress_percent"], 12.5)
+        self.assertFalse(progress["is_complete"])
+        self.assertFalse(self.campaign.is_campaign_complete())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""Unit tests for the merchant system."""
+import unittest
+from game.equipment import EquipmentItem, EquipmentSlot, ItemRarity
+from game.merchant import Merchant, MerchantManager, RARITY_PRICE_MULTIPLIERS, get_item_value
+
+
+def make_item(item_id="sword_1", level=2, rarity=ItemRarity.RARE):
+    """Create a simple weapon for pricing tests."""
+    return EquipmentItem(
+        id=item_id,
+        name="Test Sword",
+        description="A sword for testing",
+        slot=EquipmentSlot.WEAPON,
+        rarity=rarity,
+        level_required=level,
+    )
+
+
+class TestMerchantPricing(unittest.TestCase):
+    """Test merchant price calculations."""
+
+    def setUp(self):
+        """Create a merchant with fresh stock."""
+        self.merchant = Merchant("Greta", "weapons", (1, 3))
+
+    def test_multipliers_cover_all_rarities(self):
+        """Test every rarity has a price multiplier."""
+        for rarity in ItemRarity:
+            self.assertIn(rarity, RARITY_PRICE_MULTIPLIERS)
+
+    def test_stock_prices_use_rarity_multiplier(self):
+        """Test restocked items are priced by level and rarity."""
+        for item in self.merchant.inventory.items:
+            expected = int(item.level_required * 10 * RARITY_PRICE_MULTIPLIERS[item.rarity])
+            self.assertEqual(self.merchant.inventory.get_item_price(item.id), expected)
+
+    def test_sell_and_buy_price(self):
+        """Test prices for an item the merchant does not stock."""
+        item = make_item(level=2, rarity=ItemRarity.RARE)
+
+        self.assertEqual(self.merchant.get_sell_price(item), 80)
+        self.assertEqual(self.merchant.get_buy_price(item), 40)
+
+    def test_greeting_and_farewell(self):
+        """Test dialogue lines come from the merchant's tables."""
+        self.assertIn(self.merchant.get_greeting(), self.merchant.greetings)
+        self.assertIn(self.merchant.get_farewell(), Merchant.FAREWELLS)
+
+
+class TestMerchantTrading(unittest.TestCase):
+    """Test buying and selling with a merchant."""
+
+    def setUp(self):
+        """Create a merchant with fresh stock."""
+        self.merchant = Merchant("Marcus", "armor", (1, 3))
+
+    def test_sell_to_player(self):
+        """Test the player buying a stocked item."""
+        item = self.merchant.inventory.items[0]
+        price = self.merchant.inventory.get_item_price(item.id)
+
+        success, _, purchased = self.merchant.sell_to_player(item.id, price)
+
+        self.assertTrue(success)
+        self.assertIs(purchased, item)
+        self.assertFalse(self.merchant.inventory.has_item(item.id))
+        self.assertIsNone(self.merchant.inventory.get_item(item.id))
+        self.assertNotIn(item, self.merchant.inventory.items)
+        self.assertEqual(self.merchant.gold, 1000 + price)
+
+    def test_remove_items_keeps_index_consistent(self):
+        """Test removing items in any order keeps lookups working."""
+        inventory = self.merchant.inventory
+        remaining = list(inventory.items)
+
+        for item in [remaining[len(remaining) // 2], remaining[0], remaining[-1]]:
+            self.assertIs(inventory.remove_item(item.id), item)
+            remaining.remove(item)
+
+        self.assertEqual(len(inventory.items), len(remaining))
+        for item in remaining:
+            self.assertIs(inventory.get_item(item.id), item)
+            self.assertEqual(inventory.get_item_price(item.id), int(get_item_value(item)))
+        self.assertIsNone(inventory.remove_item(remaining[0].id + "_missing"))
+
+    def test_sell_to_player_not_enough_gold(self):
+        """Test the player cannot buy without enough gold."""
+        item = self.merchant.inventory.items[0]
+
+        success, _, purchased = self.merchant.sell_to_player(item.id, 0)
+
+        self.assertFalse(success)
+        self.assertIsNone(purchased)
+        self.assertTrue(self.merchant.inventory.has_item(item.id))
+
+    def test_sell_unknown_item(self):
+        """Test selling an item the merchant does not have."""
+        success, _, purchased = self.merchant.sell_to_player("missing", 10000)
+
+        self.assertFalse(success)
+        self.assertIsNone(purchased)
+
+    def test_buy_from_player(self):
+        """Test the merchant buying an item from the player."""
+        item = make_item(level=2, rarity=ItemRarity.RARE)
+
+        success, _, paid = self.merchant.buy_from_player(item)
+
+        self.assertTrue(success)
+        self.assertEqual(paid, 40)
+        self.assertEqual(self.merchant.gold, 960)
+        self.assertTrue(self.merchant.inventory.has_item(item.id))
+        self.assertEqual(self.merchant.inventory.get_item_price(item.id), 80)
+
+
+class TestMerchantManager(unittest.TestCase):
+    """Test MerchantManager."""
+
+    def test_create_and_restock(self):
+        """Test creating merchants and restocking them."""
+        manager = MerchantManager()
+        merchant = manager.create_merchant("Elena", "accessories")
+
+        self.assertIs(manager.get_merchant("Elena"), merchant)
+
+        manager.restock_all()
+        self.assertTrue(5 <= len(merchant.inventory.items) <= 10)
+        for item in merchant.inventory.items:
+            self.assertEqual(item.slot, EquipmentSlot.ACCESSORY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 """Tests for Phase 5: Game Logic & NPCs (NPCs, Dialogue, Quests, Pathfinding)."""
+import math
 import pytest
 import numpy as np
 import glm
+import config
 from game.npc import NPC, NPCManager, NPCState, NPCBehavior
 from game.dialogue import (
     DialogueNode, DialogueTree, DialogueManager,
@@ -72,6 +74,61 @@ class TestNPC:
         # Can interact after cooldown
         assert npc.can_interact(player_pos, current_time + 2.0) == True
 
+    def test_npc_matrix_cache(self):
+        """Test NPC matrices are cached until the NPC moves or updates."""
+        npc = NPC(glm.vec3(1, 2, 3), name="Statue")
+
+        model = npc.get_model_matrix()
+        assert npc.get_model_matrix() is model
+        assert glm.vec3(model[3]) == npc.get_render_position()
+
+        npc.position = glm.vec3(5, 0, 0)
+        moved = npc.get_model_matrix()
+        assert moved is not model
+        assert moved[3].x == pytest.approx(5.0)
+
+        npc.update(0.1)
+        assert npc.get_model_matrix() is not moved
+        assert npc.get_model_matrix()[3].y == pytest.approx(npc.bob_height, abs=1e-6)
+
+    def test_npc_normal_matrix(self):
+        """Test the closed-form NPC normal matrix matches the inverse transpose."""
+        npc = NPC(glm.vec3(1, 2, 3), name="Turner")
+        npc.rotation = glm.vec3(0, 73, 0)
+
+        expected = glm.mat3(glm.transpose(glm.inverse(npc.get_model_matrix())))
+        normal = npc.get_normal_matrix()
+        for col in range(3):
+            for row in range(3):
+                assert normal[col][row] == pytest.approx(expected[col][row], abs=1e-5)
+
+    def test_idle_npc_sleeps_far_from_player(self):
+        """Test idle NPCs far from the player skip AI but keep their clock."""
+        npc = NPC(glm.vec3(0, 0, 0), name="Sleeper")
+        model = npc.get_model_matrix()
+        far_away = glm.vec3(config.NPC_SLEEP_DISTANCE + 10.0, 0, 0)
+
+        npc.update(0.5, far_away)
+        assert npc.animation_time == pytest.approx(0.5)
+        assert npc.bob_height == 0.0
+        assert npc.get_model_matrix() is model
+
+        # Waking up picks the bob up from the advanced clock
+        npc.update(0.1, glm.vec3(1, 0, 0))
+        assert npc.bob_height == pytest.approx(
+            math.sin(0.6 * config.NPC_BOB_SPEED) * config.NPC_BOB_HEIGHT
+        )
+
+    def test_sleeping_npc_coasts_to_a_stop(self):
+        """Test an NPC that goes idle while moving keeps slowing down far from the player."""
+        npc = NPC(glm.vec3(0, 0, 0), name="Drifter")
+        npc.velocity = glm.vec3(2.0, 0, 0)
+        far_away = glm.vec3(config.NPC_SLEEP_DISTANCE + 10.0, 0, 0)
+
+        npc.update(0.5, far_away)
+        assert npc.position.x == pytest.approx(1.0)
+        assert npc.velocity.x == pytest.approx(1.8)
+
     def test_npc_manager(self):
         """Test NPC manager."""
         manager = NPCManager()
@@ -95,6 +152,37 @@ class TestNPC:
         nearby = manager.get_interactable_npc(player_pos, 0.0)
         assert nearby == npc1  # Closest to player
 
+    def test_npc_manager_interactable_skips_cooldown(self):
+        """Test the closest NPC on cooldown is skipped for the next in range."""
+        manager = NPCManager()
+        near = NPC(glm.vec3(0, 0, 0), name="Near")
+        far = NPC(glm.vec3(2, 0, 0), name="Far")
+        out_of_range = NPC(glm.vec3(50, 0, 0), name="Distant")
+        for npc in (near, far, out_of_range):
+            manager.add_npc(npc)
+
+        player_pos = glm.vec3(0.5, 0, 0)
+        assert manager.get_interactable_npc(player_pos, 0.0) == near
+
+        near.start_interaction(0.0)
+        assert manager.get_interactable_npc(player_pos, 0.5) == far
+
+        far.start_interaction(0.5)
+        assert manager.get_interactable_npc(player_pos, 1.0) is None
+
+    def test_npc_manager_interactable_sees_changes(self):
+        """Test interaction queries use current NPC positions and ranges."""
+        manager = NPCManager()
+        npc = NPC(glm.vec3(0, 0, 0), name="Wanderer")
+        manager.add_npc(npc)
+        player_pos = glm.vec3(0.5, 0, 0)
+
+        npc.position = glm.vec3(40, 0, 0)
+        assert manager.get_interactable_npc(player_pos, 0.0) is None
+
+        npc.interaction_range = 50.0
+        assert manager.get_interactable_npc(player_pos, 0.0) == npc
+
 
 class TestDialogue:
     """Test dialogue system."""
@@ -236,6 +324,25 @@ class TestQuests:
         assert objective.completed == True
         assert objective.get_progress_text() == "5/5"
 
+    def test_objective_waypoint_factory(self):
+        """Test waypoint factories run only when the waypoint is first read."""
+        objective = QuestObjective("talk", "Talk to someone", ObjectiveType.TALK_TO)
+        calls = []
+
+        def make_waypoint():
+            calls.append(1)
+            return "waypoint"
+
+        objective.set_waypoint_factory(make_waypoint)
+        assert calls == []
+
+        assert objective.waypoint == "waypoint"
+        assert objective.waypoint == "waypoint"
+        assert len(calls) == 1
+
+        objective.set_waypoint(None)
+        assert objective.waypoint is None
+
     def test_quest_creation(self):
         """Test quest creation."""
         quest = Quest("find_artifact", "Find the Ancient Artifact", "Search the ruins...")
@@ -281,6 +388,43 @@ class TestQuests:
         assert completed == True
         assert quest.status == QuestStatus.COMPLETED
 
+    def test_progress_objective_by_id(self):
+        """Test progressing a specific objective by its ID."""
+        quest = Quest("hunt", "The Hunt")
+        wolves = QuestObjective("wolves", "Defeat wolves", ObjectiveType.DEFEAT)
+        wolves.set_target(2)
+        quest.add_objective(wolves)
+        quest.add_objective(QuestObjective("report", "Report back"))
+        quest.start()
+
+        assert quest.progress_objective("missing") == False
+        quest.progress_objective("wolves")
+        assert wolves.current == 1
+        quest.progress_objective("wolves")
+        assert wolves.completed == True
+        assert quest.current_objective_index == 1
+
+    def test_quest_progress_text_tracks_objectives(self):
+        """Test progress text follows objective completion and reset."""
+        quest = Quest("errands", "Errands")
+        gems = QuestObjective("gems", "Collect gems", ObjectiveType.COLLECT)
+        gems.set_target(3)
+        quest.add_objective(gems)
+        quest.add_objective(QuestObjective("shrine", "Visit the shrine"))
+        quest.start()
+
+        assert quest.get_progress_text() == "0/2 objectives"
+        assert gems.get_progress_text() == "0/3"
+
+        quest.progress_objective("gems", 3)
+        assert gems.get_progress_text() == "3/3"
+        assert quest.get_progress_text() == "1/2 objectives"
+
+        quest.reset()
+        quest.start()
+        assert gems.get_progress_text() == "0/3"
+        assert quest.get_progress_text() == "0/2 objectives"
+
     def test_quest_manager(self):
         """Test quest manager."""
         manager = QuestManager()
@@ -305,6 +449,50 @@ class TestQuests:
 
         assert manager.is_quest_completed("tutorial") == True
 
+    def test_quest_manager_update_polls_completion(self):
+        """Test update completes quests whose objectives report done."""
+        manager = QuestManager()
+        quest = Quest("explore", "Explore")
+        objective = QuestObjective("see_tower", "See the tower")
+        flags = {"seen": False}
+        objective.set_completion_func(lambda: flags["seen"])
+        quest.add_objective(objective)
+        manager.register_quest(quest)
+        manager.start_quest("explore")
+
+        manager.update()
+        assert manager.is_quest_active("explore") == True
+
+        flags["seen"] = True
+        manager.update()
+        assert manager.is_quest_completed("explore") == True
+        assert quest.get_progress_text() == "Complete"
+
+    def test_quest_completes_when_last_objective_does(self):
+        """Test completing objectives out of order completes the quest at once."""
+        manager = QuestManager()
+        quest = manager.create_simple_quest(
+            "chores", "Chores", "", [("Sweep", 1), ("Fetch water", 1)]
+        )
+        finished = []
+        quest.on_complete = lambda: finished.append(manager.is_quest_completed("chores"))
+        manager.start_quest("chores")
+
+        assert manager.progress_quest("chores", "chores_obj_1") == False
+        assert manager.progress_quest("chores", "chores_obj_0") == True
+        assert manager.is_quest_completed("chores") == True
+        assert manager.is_quest_active("chores") == False
+        assert finished == [True]
+
+    def test_quest_manager_register_quests(self):
+        """Test registering several quests at once."""
+        manager = QuestManager()
+        quests = [Quest("q1", "First"), Quest("q2", "Second")]
+
+        assert manager.register_quests(quests) == ["q1", "q2"]
+        assert manager.get_quest("q1") is quests[0]
+        assert manager.get_quest("q2") is quests[1]
+
 
 class TestPathfinding:
     """Test pathfinding system."""
@@ -312,7 +500,8 @@ class TestPathfinding:
     def test_heuristic(self):
         """Test heuristic function."""
         dist = heuristic(0, 0, 10, 5)
-        assert dist == 15  # Manhattan distance
+        assert dist == pytest.approx(5 + 5 * 1.414)  # Octile distance
+        assert heuristic(3, 0, 3, 7) == pytest.approx(7)
 
     def test_astar_simple(self):
         """Test A* with simple grid."""
@@ -344,6 +533,29 @@ class TestPathfinding:
             x, z = path[i]
             assert grid[z, x] == 0  # All path cells should be walkable
 
+    def test_astar_path_is_connected(self):
+        """Test A* returns a chain of adjacent walkable cells around walls."""
+        grid = np.zeros((40, 40), dtype=np.int32)
+        grid[5:35, 10] = 1  # Wall with gaps at both ends
+        grid[0:30, 25] = 1  # Wall with a gap at the far end
+
+        path = astar_search(grid, 0, 20, 39, 5)
+
+        assert len(path) > 0
+        assert tuple(path[0]) == (0, 20)
+        assert tuple(path[-1]) == (39, 5)
+        for (x1, z1), (x2, z2) in zip(path[:-1], path[1:]):
+            assert max(abs(x2 - x1), abs(z2 - z1)) == 1
+            assert grid[z2, x2] == 0
+
+    def test_astar_no_diagonal_squeeze(self):
+        """Test A* does not cut diagonally between two blocked cells."""
+        grid = np.zeros((3, 3), dtype=np.int32)
+        grid[0, 1] = 1
+        grid[1, 0] = 1
+
+        assert len(astar_search(grid, 0, 0, 1, 1)) == 0
+
     def test_astar_no_path(self):
         """Test A* when no path exists."""
         # Create grid with complete wall
@@ -379,6 +591,26 @@ class TestPathfinding:
         assert abs(wx - 10.5) < 0.01
         assert abs(wz - 10.5) < 0.01
 
+    def test_block_shapes_clip_to_grid(self):
+        """Test blocking circles and rectangles, including past the grid edge."""
+        nav_grid = NavigationGrid(width=20, height=10, cell_size=1.0)
+
+        nav_grid.block_circle(5.5, 5.5, 1.5)  # Grid radius 2 around (5, 5)
+        for gx in range(20):
+            for gz in range(10):
+                in_circle = (gx - 5) ** 2 + (gz - 5) ** 2 <= 4
+                assert nav_grid.is_walkable(gx, gz) != in_circle
+
+        nav_grid.block_rect(18, 8, 30, 30)
+        assert not nav_grid.is_walkable(19, 9)
+        assert not nav_grid.is_walkable(18, 8)
+        assert nav_grid.is_walkable(17, 9)
+
+        # Shapes entirely outside the grid are ignored
+        nav_grid.block_circle(-50, -50, 2)
+        nav_grid.block_rect(40, 40, 50, 50)
+        assert nav_grid.grid.sum() == 13 + 4
+
     def test_find_path(self):
         """Test finding path with navigation grid."""
         nav_grid = NavigationGrid(width=20, height=20, cell_size=1.0)
@@ -400,6 +632,25 @@ class TestPathfinding:
             gx, gz = nav_grid.world_to_grid(waypoint.x, waypoint.z)
             assert nav_grid.is_walkable(gx, gz)
 
+    def test_find_path_cache_invalidated_by_blocking(self):
+        """Test repeated queries reuse the path until the grid changes."""
+        nav_grid = NavigationGrid(width=20, height=20, cell_size=1.0)
+        start = glm.vec3(0.5, 0, 10.5)
+        goal = glm.vec3(19.5, 0, 10.5)
+
+        straight = nav_grid.find_path(start, goal)
+        assert nav_grid.find_path(start, goal) == straight
+        assert len(nav_grid._path_cache) == 1
+
+        # A wall across the straight line forces a different path
+        nav_grid.block_rect(10, 5, 10, 15)
+        assert not nav_grid._path_cache
+
+        detour = nav_grid.find_path(start, goal)
+        assert detour != straight
+        for waypoint in detour:
+            assert nav_grid.is_walkable(*nav_grid.world_to_grid(waypoint.x, waypoint.z))
+
     def test_path_follower(self):
         """Test path follower."""
         # Create simple path
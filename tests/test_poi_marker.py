@@ -0,0 +1,106 @@
+"""Unit tests for POI world markers."""
+import math
+import unittest
+import glm
+from world_gen.poi_generator import POI, POIType
+from game.poi_marker import POIMarker, POIMarkerManager
+
+
+def make_marker(poi_type=POIType.SHRINE, name="Test Shrine"):
+    """Create a marker for a POI at the origin."""
+    return POIMarker(POI(poi_type, glm.vec3(0.0, 10.0, 0.0), name))
+
+
+class TestPOIMarkerAnimation(unittest.TestCase):
+    """Test marker bobbing and rotation."""
+
+    def test_markers_bob_in_lockstep(self):
+        """Test markers with the same clock and speed bob identically."""
+        markers = [make_marker(), make_marker(POIType.VILLAGE, "Village")]
+
+        for _ in range(3):
+            for marker in markers:
+                marker.update(0.25)
+
+        expected = 15.0 + abs(math.sin(0.75)) * 0.5
+        for marker in markers:
+            self.assertAlmostEqual(marker.position.y, expected, places=5)
+
+    def test_bob_speed_is_respected(self):
+        """Test markers with different bob speeds get their own offset."""
+        slow = make_marker()
+        fast = make_marker()
+        fast.bob_speed = 3.0
+
+        slow.update(0.5)
+        fast.update(0.5)
+
+        self.assertAlmostEqual(slow.position.y, 15.0 + abs(math.sin(0.5)) * 0.5, places=5)
+        self.assertAlmostEqual(fast.position.y, 15.0 + abs(math.sin(1.5)) * 0.5, places=5)
+
+
+class TestPOIMarkerManager(unittest.TestCase):
+    """Test batched marker animation."""
+
+    def test_batched_update_matches_per_marker_update(self):
+        """Test update_all animates markers exactly like update does."""
+        batched = [make_marker(), make_marker(POIType.RUIN, "Ruin")]
+        single = [make_marker(), make_marker(POIType.RUIN, "Ruin")]
+        batched[1].bob_speed = single[1].bob_speed = 2.5
+
+        manager = POIMarkerManager()
+        for marker in batched:
+            manager.add_marker(marker)
+
+        for _ in range(4):
+            manager.update_all(0.2)
+            for marker in single:
+                marker.update(0.2)
+
+        for a, b in zip(batched, single):
+            self.assertAlmostEqual(a.time, b.time, places=5)
+            self.assertAlmostEqual(a.position.y, b.position.y, places=5)
+            self.assertAlmostEqual(a.rotation.y, b.rotation.y, places=4)
+
+    def test_batched_update_refreshes_description(self):
+        """Test update_all picks up discovery changes."""
+        marker = make_marker(POIType.VILLAGE, "Oakvale")
+        manager = POIMarkerManager()
+        manager.add_marker(marker)
+
+        marker.poi.discovered = True
+        manager.update_all(0.1)
+        self.assertEqual(marker.description, "Oakvale - Village with NPCs and merchants")
+
+
+class TestPOIMarkerAppearance(unittest.TestCase):
+    """Test per-type marker descriptions, colors and scales."""
+
+    def test_description_and_color_follow_discovery(self):
+        """Test discovering a marker switches to its type-specific look."""
+        marker = make_marker(POIType.DUNGEON, "Crypt")
+        marker.poi.data['difficulty'] = 3
+        self.assertEqual(marker.description, "??? (Press E to discover)")
+        self.assertEqual(marker.get_color(), (0.5, 0.5, 0.5))
+
+        self.assertTrue(marker.discover())
+        self.assertEqual(marker.description, "Crypt - Dangerous dungeon (Level 3)")
+        self.assertEqual(marker.get_color(), (0.9, 0.2, 0.2))
+
+    def test_description_refreshes_on_external_discovery(self):
+        """Test update picks up a POI discovered by another system."""
+        marker = make_marker(POIType.RUIN, "Old Tower")
+        marker.poi.discovered = True
+        marker.update(0.1)
+        self.assertEqual(marker.description, "Old Tower - Ancient ruins with loot")
+
+    def test_scale_is_not_shared(self):
+        """Test markers of the same type get independent scale vectors."""
+        a = make_marker()
+        b = make_marker()
+        a.scale.y = 100.0
+        self.assertEqual(b.scale, glm.vec3(2.0, 6.0, 2.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
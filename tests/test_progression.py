@@ -1,5 +1,6 @@
 """Unit tests for character progression and leveling system."""
 import unittest
+from collections.abc import Mapping
 from game.progression import (
     CharacterProgression,
     LEVEL_XP_THRESHOLDS,
@@ -172,7 +173,7 @@ class TestCharacterProgression(unittest.TestCase):
 
         bonuses = progression.get_all_stat_bonuses()
 
-        self.assertIsInstance(bonuses, dict)
+        self.assertIsInstance(bonuses, Mapping)
         self.assertIn("max_health", bonuses)
         self.assertIn("max_stamina", bonuses)
         self.assertIn("base_damage", bonuses)
@@ -181,6 +182,18 @@ class TestCharacterProgression(unittest.TestCase):
         # Level 3 = 2 levels gained
         self.assertEqual(bonuses["max_health"], STATS_PER_LEVEL["max_health"] * 2)
 
+    def test_stat_bonuses_are_read_only(self):
+        """Test callers can't change the bonuses shared by every character at a level."""
+        bonuses = CharacterProgression(starting_level=3).get_all_stat_bonuses()
+
+        with self.assertRaises(TypeError):
+            bonuses["max_health"] = 999
+
+        self.assertEqual(
+            CharacterProgression(starting_level=3).get_stat_bonus("max_health"),
+            STATS_PER_LEVEL["max_health"] * 2,
+        )
+
     def test_set_level(self):
         """Test manually setting level."""
         progression = CharacterProgression()
@@ -0,0 +1,89 @@
+"""Unit tests for puzzle elements."""
+import gc
+import unittest
+import glm
+from game.puzzles import Door, Lever, PressurePlate, PuzzleElement, PuzzleState
+
+
+class RecordingElement(PuzzleElement):
+    """Puzzle element that records which elements triggered it."""
+
+    def __init__(self, name, log):
+        super().__init__(glm.vec3(0.0), name)
+        self.log = log
+
+    def on_triggered(self, source):
+        self.log.append(self.name)
+
+
+class TestPuzzleConnections(unittest.TestCase):
+    """Test connections between puzzle elements."""
+
+    def test_connections_dedupe_and_keep_order(self):
+        """Test each target triggers once, in the order it was connected."""
+        log = []
+        lever = Lever(glm.vec3(0.0), "Lever")
+        first = RecordingElement("first", log)
+        second = RecordingElement("second", log)
+
+        lever.connect_to(second)
+        lever.connect_to(first)
+        lever.connect_to(second)
+        lever.activate()
+
+        self.assertEqual(log, ["second", "first"])
+
+
+    def test_unloaded_element_is_disconnected(self):
+        """Test connections don't keep unloaded elements alive."""
+        log = []
+        lever = Lever(glm.vec3(0.0), "Lever")
+        kept = RecordingElement("kept", log)
+        unloaded = RecordingElement("unloaded", log)
+        lever.connect_to(unloaded)
+        lever.connect_to(kept)
+
+        del unloaded
+        gc.collect()
+        lever.activate()
+
+        self.assertEqual(log, ["kept"])
+        self.assertEqual(len(lever.connected_elements), 1)
+
+
+class TestDoor(unittest.TestCase):
+    """Test door movement."""
+
+    def test_open_close_positions_are_not_shared(self):
+        """Test closing restores the closed position without aliasing it."""
+        door = Door(glm.vec3(1.0, 0.0, 2.0), "Gate", locked=False)
+
+        door.open()
+        self.assertEqual(door.position, glm.vec3(1.0, 2.5, 2.0))
+
+        door.close()
+        door.position.y += 5.0  # In-place edit must not leak into closed_position
+        self.assertEqual(door.closed_position, glm.vec3(1.0, 0.0, 2.0))
+
+        door.open()
+        self.assertEqual(door.position, glm.vec3(1.0, 2.5, 2.0))
+
+
+class TestPressurePlate(unittest.TestCase):
+    """Test pressure plate activation."""
+
+    def test_pressed_while_player_stands_on_plate(self):
+        """Test the plate activates under the player and releases once they leave."""
+        plate = PressurePlate(glm.vec3(10.0, 0.0, 0.0), "Plate")
+
+        plate.check_activation(glm.vec3(10.2, 0.5, -0.3))
+        self.assertEqual(plate.state, PuzzleState.ACTIVE)
+        self.assertEqual(plate.position, glm.vec3(10.0, -0.05, 0.0))
+
+        plate.check_activation(glm.vec3(10.5, 0.0, 0.6))
+        self.assertEqual(plate.state, PuzzleState.INACTIVE)
+        self.assertEqual(plate.position, glm.vec3(10.0, 0.0, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
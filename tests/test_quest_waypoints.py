@@ -0,0 +1,109 @@
+"""Unit tests for quest waypoint navigation."""
+import unittest
+from game.quest_waypoints import (
+    QuestWaypoint,
+    WaypointManager,
+    WaypointType,
+    create_waypoint_for_area,
+)
+
+
+def make_waypoint(name, x, z, radius=5.0):
+    """Create a location waypoint at (x, 0, z)."""
+    return QuestWaypoint(
+        position=(x, 0.0, z),
+        waypoint_type=WaypointType.LOCATION,
+        name=name,
+        radius=radius,
+    )
+
+
+class TestQuestWaypoint(unittest.TestCase):
+    """Test single waypoint distance checks."""
+
+    def test_distance_and_range(self):
+        """Test distance helpers agree and the radius is inclusive."""
+        waypoint = make_waypoint("Well", 3.0, 4.0, radius=5.0)
+
+        self.assertAlmostEqual(waypoint.distance_to(0.0, 0.0), 5.0)
+        self.assertAlmostEqual(waypoint.distance_sq_to(0.0, 0.0), 25.0)
+        self.assertTrue(waypoint.is_in_range(0.0, 0.0))
+        self.assertFalse(waypoint.is_in_range(-0.1, 0.0))
+
+
+class TestWaypointManager(unittest.TestCase):
+    """Test WaypointManager queries."""
+
+    def setUp(self):
+        """Create a manager with three waypoints along the X axis."""
+        self.manager = WaypointManager()
+        self.near = make_waypoint("Near", 10.0, 0.0)
+        self.mid = make_waypoint("Mid", 50.0, 0.0)
+        self.far = make_waypoint("Far", 200.0, 0.0)
+        for waypoint in (self.far, self.near, self.mid):
+            self.manager.add_waypoint(waypoint)
+
+    def test_nearest_skips_inactive_and_completed(self):
+        """Test nearest waypoint ignores hidden and completed waypoints."""
+        self.assertIs(self.manager.get_nearest_waypoint(0.0, 0.0), self.near)
+
+        self.near.completed = True
+        self.assertIs(self.manager.get_nearest_waypoint(0.0, 0.0), self.mid)
+
+        self.mid.active = False
+        self.assertIs(self.manager.get_nearest_waypoint(0.0, 0.0), self.far)
+
+        self.far.completed = True
+        self.assertIsNone(self.manager.get_nearest_waypoint(0.0, 0.0))
+
+    def test_waypoints_in_range_keeps_list_order(self):
+        """Test range query returns active waypoints within distance."""
+        in_range = self.manager.get_waypoints_in_range(0.0, 0.0, max_distance=50.0)
+        self.assertEqual(in_range, [self.near, self.mid])
+
+    def test_update_completes_reached_waypoints(self):
+        """Test only waypoints within their radius are completed."""
+        completed = self.manager.update_waypoint_states(48.0, 3.0)
+
+        self.assertEqual(completed, [self.mid])
+        self.assertTrue(self.mid.completed)
+        self.assertFalse(self.near.completed)
+
+        # Already completed waypoints are not reported again
+        self.assertEqual(self.manager.update_waypoint_states(48.0, 3.0), [])
+
+    def test_waypoint_count(self):
+        """Test counts reflect flags set directly on waypoints."""
+        self.assertEqual(self.manager.get_waypoint_count(), (3, 3))
+        self.far.completed = True
+        self.assertEqual(self.manager.get_waypoint_count(), (2, 3))
+
+    def test_queries_follow_moved_waypoints(self):
+        """Test queries see positions and radii reassigned after earlier queries."""
+        self.assertIs(self.manager.get_nearest_waypoint(0.0, 0.0), self.near)
+        self.assertEqual(self.manager.update_waypoint_states(200.0, 20.0), [])
+
+        self.far.position = (1.0, 0.0, 0.0)
+        self.assertIs(self.manager.get_nearest_waypoint(0.0, 0.0), self.far)
+        self.assertEqual(self.manager.get_waypoints_in_range(0.0, 0.0, max_distance=5.0), [self.far])
+
+        self.mid.radius = 30.0
+        self.assertEqual(self.manager.update_waypoint_states(50.0, 20.0), [self.mid])
+
+    def test_queries_follow_add_and_remove(self):
+        """Test queries see waypoints added or removed after earlier queries."""
+        self.assertIs(self.manager.get_nearest_waypoint(100.0, 0.0), self.mid)
+
+        area = create_waypoint_for_area("Camp", (110.0, 0.0, 0.0))
+        self.manager.add_waypoint(area)
+        self.assertIs(self.manager.get_nearest_waypoint(100.0, 0.0), area)
+
+        self.manager.remove_waypoint(area)
+        self.assertIs(self.manager.get_nearest_waypoint(100.0, 0.0), self.mid)
+
+        self.manager.clear_waypoints()
+        self.assertIsNone(self.manager.get_nearest_waypoint(100.0, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,13 @@
 """Tests for the save/load system."""
+import copy
 import pytest
 import os
 import shutil
 import json
 import glm
 from pathlib import Path
-from game.save_system import SaveSystem, serialize_game_state, deserialize_game_state
+import game.save_system as save_system_module
+from game.save_system import SaveDataValidator, SaveSystem, serialize_game_state, deserialize_game_state
 from game.player import Player
 from game.inventory import Inventory
 from game.quests import QuestManager
@@ -118,6 +120,27 @@ class TestSaveSystem:
         assert info["player_level"] == 5
         assert info["play_time"] == 3600.0
 
+    def test_get_save_info_tracks_file_changes(self, save_system, sample_game_state):
+        """Test cached save info is refreshed when the save is overwritten or deleted."""
+        save_system.save_game(1, sample_game_state)
+        assert save_system.get_save_info(1)["player_level"] == 5
+
+        sample_game_state["player"]["level"] = 12
+        save_system.save_game(1, sample_game_state)
+        assert save_system.get_save_info(1)["player_level"] == 12
+
+        # Same-size overwrite within one timestamp tick
+        save_file = save_system.save_dir / "save_slot_1.json"
+        stat = save_file.stat()
+        sample_game_state["play_time"] = 7200.0
+        save_system.save_game(1, sample_game_state)
+        os.utime(save_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert save_file.stat().st_size == stat.st_size
+        assert save_system.get_save_info(1)["play_time"] == 7200.0
+
+        save_system.delete_save(1)
+        assert save_system.get_save_info(1) is None
+
     def test_get_save_info_nonexistent(self, save_system):
         """Test getting info for non-existent save."""
         info = save_system.get_save_info(2)
@@ -153,6 +176,40 @@ class TestSaveSystem:
         assert loaded1["player"]["gold"] == 500
         assert loaded2["player"]["gold"] == 1000
 
+    def test_stdlib_json_fallback(self, save_system, sample_game_state, monkeypatch):
+        """Test saves round-trip when orjson is not installed."""
+        monkeypatch.setattr(save_system_module, "orjson", None)
+
+        assert save_system.save_game(1, sample_game_state) is True
+        assert save_system.load_game(1) == sample_game_state
+
+    def test_save_validation_is_opt_in(self, save_system, sample_game_state):
+        """Test invalid state is only rejected on save when validation is requested."""
+        del sample_game_state["play_time"]
+
+        assert save_system.save_game(1, sample_game_state, validate=True) is False
+        assert not (save_system.save_dir / "save_slot_1.json").exists()
+
+        # Written unchecked, but still rejected when loaded
+        assert save_system.save_game(1, sample_game_state) is True
+        assert save_system.load_game(1) is None
+
+    def test_validate_game_state_checks_fields(self, sample_game_state):
+        """Test the validator rejects missing keys and wrong field types."""
+        assert SaveDataValidator.validate_game_state(sample_game_state) is True
+
+        bad_type = copy.deepcopy(sample_game_state)
+        bad_type["progression"]["xp"] = "1500"
+        assert SaveDataValidator.validate_game_state(bad_type) is False
+
+        missing = copy.deepcopy(sample_game_state)
+        del missing["equipment"]["armor"]
+        assert SaveDataValidator.validate_game_state(missing) is False
+
+        bad_position = copy.deepcopy(sample_game_state)
+        bad_position["player"]["position"] = [1.0, 2.0]
+        assert SaveDataValidator.validate_game_state(bad_position) is False
+
     def test_overwrite_save(self, save_system, sample_game_state):
         """Test overwriting an existing save."""
         save_system.save_game(1, sample_game_state)